@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
 
 import lemlem
 from lemlem import LLMClient
@@ -11,6 +13,40 @@ from lemlem.adapter import LLMAdapter
 
 from .settings import settings
 
+__all__ = ["AgentRuntimeResult", "LemlemAgentRuntime"]
+
+_USAGE_KEYS = ("prompt_tokens", "completion_tokens", "total_tokens", "cost")
+
+
+def _pick_usage(usage: Any) -> dict[str, Any] | None:
+    # Copy only the accounting fields instead of the whole usage object __dict__.
+    # chat_json reports usage as a plain dict, generate() as an object.
+    if usage is None:
+        return None
+    if isinstance(usage, Mapping):
+        picked = {key: usage.get(key) for key in _USAGE_KEYS}
+    else:
+        picked = {key: getattr(usage, key, None) for key in _USAGE_KEYS}
+    return picked if any(value is not None for value in picked.values()) else None
+
+
+def _is_anthropic_model(model: str) -> bool:
+    lowered = model.lower()
+    return lowered.startswith("anthropic") or "claude" in lowered
+
+
+def _system_message(model: str, system_prompt: str) -> dict[str, Any]:
+    # Anthropic only reuses a cached prefix when the block is marked explicitly;
+    # OpenAI-style providers cache identical prefixes automatically.
+    if settings.llm_prompt_caching and _is_anthropic_model(model):
+        return {
+            "role": "system",
+            "content": [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}},
+            ],
+        }
+    return {"role": "system", "content": system_prompt}
+
 
 @dataclass
 class AgentRuntimeResult:
@@ -29,10 +65,17 @@ class LemlemAgentRuntime:
     def __init__(self) -> None:
         # Let LLMAdapter own refresh behavior so DB/YAML config changes propagate.
         self.adapter = LLMAdapter()
+        self._client: LLMClient | None = None
+        self._client_fetched_at = 0.0
 
     def _get_client(self) -> LLMClient:
-        # Shared, auto-refreshing client owned by lemlem (T4.1).
-        return lemlem.get_client()
+        # Shared, auto-refreshing client owned by lemlem (T4.1). Re-resolve it at
+        # most once per TTL so model config refreshes stay off the hot path.
+        now = time.monotonic()
+        if self._client is None or now - self._client_fetched_at >= settings.model_data_ttl_seconds:
+            self._client = lemlem.get_client()
+            self._client_fetched_at = now
+        return self._client
 
     def run_prompt(
         self,
@@ -46,7 +89,7 @@ class LemlemAgentRuntime:
             selected_model = (model or settings.default_lemlem_model).strip()
             messages = []
             if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
+                messages.append(_system_message(selected_model, system_prompt))
             messages.append({"role": "user", "content": prompt})
             result = self._get_client().generate(
                 model=selected_model,
@@ -54,7 +97,7 @@ class LemlemAgentRuntime:
                 temperature=temperature,
             )
             usage = result.get_usage()
-            usage_dict = vars(usage) if usage is not None and hasattr(usage, "__dict__") else None
+            usage_dict = _pick_usage(usage)
             return AgentRuntimeResult(
                 success=True,
                 text=result.text or "",
@@ -65,6 +108,32 @@ class LemlemAgentRuntime:
         except Exception as exc:  # noqa: BLE001
             return AgentRuntimeResult(success=False, error=str(exc))
 
+    def _concurrency_limit(self) -> asyncio.Semaphore:
+        # Shared by every run_prompts_async call on this runtime, so concurrent
+        # requests together stay under llm_max_concurrency; asyncio primitives
+        # cannot cross event loops, so rebuild it if the loop changes. Created
+        # lazily so runtimes that skip __init__ (test doubles) still get one.
+        loop = asyncio.get_running_loop()
+        bound = getattr(self, "_semaphore", None)
+        if bound is None or bound[0] is not loop:
+            bound = (loop, asyncio.Semaphore(max(settings.llm_max_concurrency, 1)))
+            self._semaphore = bound
+        return bound[1]
+
+    async def run_prompt_async(self, **kwargs: Any) -> AgentRuntimeResult:
+        # lemlem clients are synchronous; keep the blocking HTTP call off the event loop.
+        return await asyncio.to_thread(self.run_prompt, **kwargs)
+
+    async def run_prompts_async(self, prompts: list[dict[str, Any]]) -> list[AgentRuntimeResult]:
+        """Run several `run_prompt` calls concurrently, preserving input order."""
+        semaphore = self._concurrency_limit()
+
+        async def _run(item: dict[str, Any]) -> AgentRuntimeResult:
+            async with semaphore:
+                return await self.run_prompt_async(**item)
+
+        return list(await asyncio.gather(*(_run(item) for item in prompts)))
+
     def run_agent_json(
         self,
         *,
@@ -74,6 +143,9 @@ class LemlemAgentRuntime:
         temperature: Optional[float] = None,
         max_tool_iterations: int = 6,
     ) -> AgentRuntimeResult:
+        # Not marked for prompt caching: chat_json builds the messages itself and
+        # only accepts the system prompt as a plain string. Callers keep dynamic
+        # ticket data in `payload`, so the system prompt is still a stable prefix.
         try:
             selected_model = (model or settings.default_lemlem_model).strip()
             response = self.adapter.chat_json(
@@ -84,7 +156,7 @@ class LemlemAgentRuntime:
                 max_tool_iterations=max_tool_iterations,
             )
             usage = response.get("usage")
-            usage_dict = vars(usage) if usage is not None and hasattr(usage, "__dict__") else None
+            usage_dict = _pick_usage(usage)
             return AgentRuntimeResult(
                 success=True,
                 text=str(response.get("final_text") or response.get("text") or ""),
@@ -94,3 +166,6 @@ class LemlemAgentRuntime:
             )
         except Exception as exc:  # noqa: BLE001
             return AgentRuntimeResult(success=False, error=str(exc))
+
+    async def run_agent_json_async(self, **kwargs: Any) -> AgentRuntimeResult:
+        return await asyncio.to_thread(self.run_agent_json, **kwargs)
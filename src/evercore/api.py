@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Generator, Iterator
+from contextlib import asynccontextmanager
+from datetime import datetime
 
 import uvicorn
+from anyio import to_thread
 from fastapi import Depends, FastAPI, HTTPException, Query
-from sqlmodel import Session, select
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
 
-from evercore.db import create_db_and_tables, get_session
+from evercore.db import create_db_and_tables, get_session, session_scope
+from evercore.event_bus import wait_for_schedule_change
 from evercore.executors import ExecutorRegistry
+from evercore.executors.registry import shared_agent_runtime
 from evercore.models import Task
+from evercore.repositories import get_ticket_by_ticket_id, iter_ticket_events
 from evercore.schemas import (
+    AgentBatchRunRequest,
+    AgentRunResult,
     ScheduleCreateRequest,
+    ScheduleRunDueResponse,
     ScheduleSummary,
     ScheduleTriggerResponse,
     TaskCancelRequestResponse,
@@ -31,12 +43,86 @@ from evercore.settings import settings
 from evercore.time_utils import now_utc
 from evercore.workflow import WorkflowLoader
 
-app = FastAPI(title="evercore", version="0.1.0")
+__all__ = ["app", "main"]
+
+logger = logging.getLogger(__name__)
 
 workflow_loader = WorkflowLoader(settings.workflow_dir_path)
 ticket_service = TicketService(workflow_loader)
 scheduler_service = SchedulerService(ticket_service)
 worker_service = WorkerService(ExecutorRegistry.default())
+# Same runtime the default executors use, so its concurrency cap is process-wide.
+agent_runtime = shared_agent_runtime()
+
+
+def _process_due_schedules_once() -> float:
+    """Run one scheduler pass and return how long the loop may idle afterwards."""
+    with session_scope() as session:
+        processed = scheduler_service.process_due_schedules(session, limit=settings.schedule_batch_size)
+        if processed >= settings.schedule_batch_size:
+            return 0.0
+        # Other processes only wake this loop through NOTIFY, so keep polling elsewhere.
+        if session.get_bind().dialect.name == "postgresql":
+            max_seconds = settings.scheduler_max_idle_seconds
+        else:
+            max_seconds = settings.scheduler_interval_seconds
+        idle_seconds = scheduler_service.seconds_until_next_due(session, max_seconds=max_seconds)
+        # A short batch with rows still due means another process holds them under
+        # SKIP LOCKED; back off to the poll interval instead of spinning on them.
+        return idle_seconds if idle_seconds > 0 else settings.scheduler_interval_seconds
+
+
+def _process_task_once() -> WorkerRunResponse:
+    with session_scope() as session:
+        return worker_service.process_once(session, worker_id=settings.resolved_worker_id)
+
+
+async def _scheduler_loop() -> None:
+    while True:
+        try:
+            idle_seconds = await asyncio.to_thread(_process_due_schedules_once)
+            if idle_seconds > 0:
+                # Sleep until the next schedule is due, or until one is created/resumed.
+                await asyncio.to_thread(wait_for_schedule_change, idle_seconds)
+            continue
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("background scheduler failure: %s", exc)
+        await asyncio.sleep(settings.scheduler_interval_seconds)
+
+
+async def _worker_loop() -> None:
+    while True:
+        try:
+            result = await asyncio.to_thread(_process_task_once)
+            if result.processed:
+                continue
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("background worker failure: %s", exc)
+        await asyncio.sleep(settings.worker_poll_interval_seconds)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Routes that touch the database stay sync and run on anyio's worker
+    # threads; size that pool explicitly instead of relying on the default.
+    to_thread.current_default_thread_limiter().total_tokens = max(settings.api_threadpool_size, 1)
+    if settings.auto_migrate:
+        create_db_and_tables()
+
+    background_tasks: list[asyncio.Task] = []
+    if settings.api_run_scheduler:
+        background_tasks.append(asyncio.create_task(_scheduler_loop()))
+    if settings.api_run_worker:
+        background_tasks.append(asyncio.create_task(_worker_loop()))
+    try:
+        yield
+    finally:
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+
+
+app = FastAPI(title="evercore", version="0.1.0", lifespan=lifespan)
 
 
 def db_session() -> Generator[Session, None, None]:
@@ -51,13 +137,18 @@ def db_session() -> Generator[Session, None, None]:
         session.close()
 
 
-@app.on_event("startup")
-def startup() -> None:
-    create_db_and_tables()
+def read_session() -> Generator[Session, None, None]:
+    # GET endpoints never write, so skip autoflush and the COMMIT round-trip.
+    session = get_session()
+    session.autoflush = False
+    try:
+        yield session
+    finally:
+        session.close()
 
 
 @app.get("/health")
-def health() -> dict:
+async def health() -> dict[str, str]:
     return {"status": "ok", "service": "evercore"}
 
 
@@ -69,23 +160,21 @@ def create_ticket(payload: TicketCreateRequest, session: Session = Depends(db_se
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-    summary = ticket_service.get_ticket_summary(session, ticket.ticket_id)
-    if summary is None:
-        raise HTTPException(status_code=500, detail="ticket was created but could not be reloaded")
-    return summary
+    return ticket_service.summarize_ticket(session, ticket, tasks=[])
 
 
 @app.get("/tickets", response_model=list[TicketSummary])
 def list_tickets(
-    session: Session = Depends(db_session),
+    session: Session = Depends(read_session),
     limit: int = Query(default=100, ge=1, le=500),
+    before: datetime | None = Query(default=None),
+    before_id: int | None = Query(default=None),
 ) -> list[TicketSummary]:
-    return ticket_service.list_ticket_summaries(session, limit=limit)
+    return ticket_service.list_ticket_summaries(session, limit=limit, before=before, before_id=before_id)
 
 
 @app.get("/tickets/{ticket_id}", response_model=TicketSummary)
-def get_ticket(ticket_id: str, session: Session = Depends(db_session)) -> TicketSummary:
+def get_ticket(ticket_id: str, session: Session = Depends(read_session)) -> TicketSummary:
     summary = ticket_service.get_ticket_summary(session, ticket_id)
     if summary is None:
         raise HTTPException(status_code=404, detail="ticket not found")
@@ -114,13 +203,12 @@ def run_worker_once(
     worker_id: str | None = Query(default=None),
     session: Session = Depends(db_session),
 ) -> WorkerRunResponse:
-    scheduler_service.process_due_schedules(session, limit=settings.schedule_batch_size)
     return worker_service.process_once(session, worker_id=worker_id)
 
 
 @app.post("/tasks/{task_id}/cancel-request", response_model=TaskCancelRequestResponse)
 def request_task_cancel(task_id: int, session: Session = Depends(db_session)) -> TaskCancelRequestResponse:
-    task = session.exec(select(Task).where(Task.id == task_id)).first()
+    task = session.get(Task, task_id)
     if task is None:
         raise HTTPException(status_code=404, detail="task not found")
 
@@ -150,7 +238,7 @@ def transition_ticket(
     session: Session = Depends(db_session),
 ) -> TicketSummary:
     try:
-        ticket_service.transition_ticket(
+        ticket = ticket_service.transition_ticket(
             session,
             ticket_id,
             target_stage=payload.target_stage,
@@ -158,37 +246,25 @@ def transition_ticket(
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-    summary = ticket_service.get_ticket_summary(session, ticket_id)
-    if summary is None:
-        raise HTTPException(status_code=404, detail="ticket not found")
-    return summary
+    return ticket_service.summarize_ticket(session, ticket)
 
 
 @app.post("/tickets/{ticket_id}/pause", response_model=TicketSummary)
 def pause_ticket(ticket_id: str, session: Session = Depends(db_session)) -> TicketSummary:
     try:
-        ticket_service.pause_ticket(session, ticket_id)
+        ticket = ticket_service.pause_ticket(session, ticket_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-    summary = ticket_service.get_ticket_summary(session, ticket_id)
-    if summary is None:
-        raise HTTPException(status_code=404, detail="ticket not found")
-    return summary
+    return ticket_service.summarize_ticket(session, ticket)
 
 
 @app.post("/tickets/{ticket_id}/resume", response_model=TicketSummary)
 def resume_ticket(ticket_id: str, session: Session = Depends(db_session)) -> TicketSummary:
     try:
-        ticket_service.resume_ticket(session, ticket_id)
+        ticket = ticket_service.resume_ticket(session, ticket_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-    summary = ticket_service.get_ticket_summary(session, ticket_id)
-    if summary is None:
-        raise HTTPException(status_code=404, detail="ticket not found")
-    return summary
+    return ticket_service.summarize_ticket(session, ticket)
 
 
 @app.post("/tickets/{ticket_id}/approval/request", response_model=TicketSummary)
@@ -198,14 +274,10 @@ def request_ticket_approval(
     session: Session = Depends(db_session),
 ) -> TicketSummary:
     try:
-        ticket_service.request_approval(session, ticket_id, notes=payload.notes)
+        ticket = ticket_service.request_approval(session, ticket_id, notes=payload.notes)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-    summary = ticket_service.get_ticket_summary(session, ticket_id)
-    if summary is None:
-        raise HTTPException(status_code=404, detail="ticket not found")
-    return summary
+    return ticket_service.summarize_ticket(session, ticket)
 
 
 @app.post("/tickets/{ticket_id}/approval/approve", response_model=TicketSummary)
@@ -215,14 +287,10 @@ def approve_ticket(
     session: Session = Depends(db_session),
 ) -> TicketSummary:
     try:
-        ticket_service.approve_ticket(session, ticket_id, notes=payload.notes)
+        ticket = ticket_service.approve_ticket(session, ticket_id, notes=payload.notes)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-    summary = ticket_service.get_ticket_summary(session, ticket_id)
-    if summary is None:
-        raise HTTPException(status_code=404, detail="ticket not found")
-    return summary
+    return ticket_service.summarize_ticket(session, ticket)
 
 
 @app.post("/tickets/{ticket_id}/approval/reject", response_model=TicketSummary)
@@ -232,14 +300,10 @@ def reject_ticket(
     session: Session = Depends(db_session),
 ) -> TicketSummary:
     try:
-        ticket_service.reject_ticket(session, ticket_id, notes=payload.notes)
+        ticket = ticket_service.reject_ticket(session, ticket_id, notes=payload.notes)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-    summary = ticket_service.get_ticket_summary(session, ticket_id)
-    if summary is None:
-        raise HTTPException(status_code=404, detail="ticket not found")
-    return summary
+    return ticket_service.summarize_ticket(session, ticket)
 
 
 @app.post("/tickets/{ticket_id}/events", response_model=TicketEventSummary, status_code=201)
@@ -257,61 +321,45 @@ def publish_ticket_event(
         )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return TicketEventSummary(
-        id=row.id,
-        ticket_id=row.ticket_id,
-        event_type=row.event_type,
-        payload=row.payload,
-        consumed_at=row.consumed_at,
-        consumed_by_task_id=row.consumed_by_task_id,
-        created_at=row.created_at,
-    )
+    return TicketEventSummary.model_validate(row)
 
 
 @app.get("/tickets/{ticket_id}/events", response_model=list[TicketEventSummary])
 def get_ticket_events(
     ticket_id: str,
-    session: Session = Depends(db_session),
+    session: Session = Depends(read_session),
     limit: int = Query(default=100, ge=1, le=500),
+    before: datetime | None = Query(default=None),
+    before_id: int | None = Query(default=None),
 ) -> list[TicketEventSummary]:
     try:
-        rows = ticket_service.get_ticket_events(session, ticket_id, limit=limit)
+        rows = ticket_service.get_ticket_events(
+            session, ticket_id, limit=limit, before=before, before_id=before_id
+        )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return [
-        TicketEventSummary(
-            id=row.id,
-            ticket_id=row.ticket_id,
-            event_type=row.event_type,
-            payload=row.payload,
-            consumed_at=row.consumed_at,
-            consumed_by_task_id=row.consumed_by_task_id,
-            created_at=row.created_at,
-        )
-        for row in rows
-    ]
+    return [TicketEventSummary.model_validate(row) for row in rows]
 
 
-def _serialize_schedule(row) -> ScheduleSummary:
-    return ScheduleSummary(
-        id=row.id,
-        schedule_key=row.schedule_key,
-        active=bool(row.active),
-        next_run_at=row.next_run_at,
-        interval_seconds=row.interval_seconds,
-        ticket_title=row.ticket_title,
-        workflow_key=row.workflow_key,
-        workflow_version=row.workflow_version,
-        workflow_input=row.workflow_input or {},
-        context_data=row.context_data or {},
-        source_type=row.source_type,
-        task_key=row.task_key,
-        task_payload=row.task_payload or {},
-        task_max_attempts=row.task_max_attempts,
-        last_run_at=row.last_run_at,
-        created_at=row.created_at,
-        updated_at=row.updated_at,
-    )
+@app.get("/tickets/{ticket_id}/events.jsonl")
+def stream_ticket_events(
+    ticket_id: str,
+    session: Session = Depends(read_session),
+    limit: int = Query(default=100, ge=1, le=500),
+) -> StreamingResponse:
+    if get_ticket_by_ticket_id(session, ticket_id) is None:
+        raise HTTPException(status_code=404, detail=f"ticket not found: {ticket_id}")
+
+    def _lines() -> Iterator[bytes]:
+        # Own session: the dependency session is not guaranteed to outlive the response body.
+        stream_session = get_session()
+        try:
+            for row in iter_ticket_events(stream_session, ticket_id, limit=limit):
+                yield TicketEventSummary.model_validate(row).model_dump_json().encode() + b"\n"
+        finally:
+            stream_session.close()
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
 
 
 @app.post("/schedules", response_model=ScheduleSummary, status_code=201)
@@ -323,16 +371,24 @@ def create_schedule(
         row = scheduler_service.create_schedule(session, payload)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return _serialize_schedule(row)
+    return ScheduleSummary.model_validate(row)
 
 
 @app.get("/schedules", response_model=list[ScheduleSummary])
 def get_schedules(
-    session: Session = Depends(db_session),
+    session: Session = Depends(read_session),
     limit: int = Query(default=100, ge=1, le=500),
+    after: datetime | None = Query(default=None),
+    after_id: int | None = Query(default=None),
 ) -> list[ScheduleSummary]:
-    rows = scheduler_service.list_schedules(session, limit=limit)
-    return [_serialize_schedule(row) for row in rows]
+    rows = scheduler_service.list_schedules(session, limit=limit, after=after, after_id=after_id)
+    return [ScheduleSummary.model_validate(row) for row in rows]
+
+
+@app.post("/schedules/run-due", response_model=ScheduleRunDueResponse)
+def run_due_schedules(session: Session = Depends(db_session)) -> ScheduleRunDueResponse:
+    processed = scheduler_service.process_due_schedules(session, limit=settings.schedule_batch_size)
+    return ScheduleRunDueResponse(processed=processed)
 
 
 @app.post("/schedules/{schedule_id}/pause", response_model=ScheduleSummary)
@@ -341,7 +397,7 @@ def pause_schedule(schedule_id: int, session: Session = Depends(db_session)) ->
         row = scheduler_service.pause_schedule(session, schedule_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return _serialize_schedule(row)
+    return ScheduleSummary.model_validate(row)
 
 
 @app.post("/schedules/{schedule_id}/resume", response_model=ScheduleSummary)
@@ -350,7 +406,7 @@ def resume_schedule(schedule_id: int, session: Session = Depends(db_session)) ->
         row = scheduler_service.resume_schedule(session, schedule_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return _serialize_schedule(row)
+    return ScheduleSummary.model_validate(row)
 
 
 @app.post("/schedules/{schedule_id}/trigger", response_model=ScheduleTriggerResponse)
@@ -362,12 +418,40 @@ def trigger_schedule(schedule_id: int, session: Session = Depends(db_session)) -
     return ScheduleTriggerResponse(schedule_id=schedule_id, triggered_ticket_id=ticket_id)
 
 
+@app.post("/agents/run-batch", response_model=list[AgentRunResult])
+async def run_agent_batch(payload: AgentBatchRunRequest) -> list[AgentRunResult]:
+    results = await agent_runtime.run_prompts_async(
+        [item.model_dump() for item in payload.prompts]
+    )
+    return [
+        AgentRunResult(
+            success=result.success,
+            text=result.text,
+            usage=result.usage,
+            provider=result.provider,
+            model_used=result.model_used,
+            error=result.error,
+        )
+        for result in results
+    ]
+
+
 def main() -> None:
     uvicorn.run(
         "evercore.api:app",
         host=settings.api_host,
         port=settings.api_port,
         reload=False,
+        workers=max(settings.api_workers, 1),
+        loop="uvloop",
+        http="httptools",
+        access_log=settings.api_access_log,
+        proxy_headers=False,
+        server_header=False,
+        date_header=False,
+        backlog=settings.api_backlog,
+        limit_concurrency=settings.api_limit_concurrency,
+        timeout_keep_alive=settings.api_timeout_keep_alive,
     )
 
 
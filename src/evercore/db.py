@@ -3,14 +3,46 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Any, Callable, Iterator, Literal
 
+import pydantic_core
 from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlmodel import Session, SQLModel, create_engine
 
 from .settings import settings
 
-_engine = create_engine(settings.database_url, echo=False)
+
+def _json_dumps(value: Any) -> str:
+    return pydantic_core.to_json(value).decode()
+
+
+def _engine_options(url: str) -> dict[str, object]:
+    # In-memory SQLite uses a singleton pool that rejects QueuePool sizing arguments.
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/") == "sqlite:"):
+        return {}
+    options: dict[str, object] = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_use_lifo": True,
+    }
+    if make_url(url).get_driver_name() == "psycopg2":
+        # Multi-row VALUES for INSERT batches, execute_batch for UPDATE/DELETE batches.
+        options["executemany_mode"] = "values_plus_batch"
+    return options
+
+
+_engine = create_engine(
+    settings.database_url,
+    echo=False,
+    query_cache_size=settings.db_query_cache_size,
+    # JSON columns go through pydantic-core's Rust codec instead of the stdlib json module.
+    json_serializer=_json_dumps,
+    json_deserializer=pydantic_core.from_json,
+    **_engine_options(settings.database_url),
+)
 
 
 def create_db_and_tables() -> None:
@@ -18,108 +50,166 @@ def create_db_and_tables() -> None:
     _run_runtime_migrations()
 
 
-def _column_exists(conn, table_name: str, column_name: str, url: str) -> bool:
-    if "postgres" in url:
-        row = conn.execute(
-            text(
-                """
-                SELECT 1
-                FROM information_schema.columns
-                WHERE table_name = :table_name
-                  AND column_name = :column_name
-                LIMIT 1
-                """
-            ),
-            {"table_name": table_name, "column_name": column_name},
-        ).fetchone()
-        return row is not None
+# Resolved once; the runtime migrations only distinguish Postgres from SQLite.
+_DIALECT: Literal["pg", "sqlite"] = "pg" if "postgres" in str(_engine.url) else "sqlite"
+_TS_TYPE = "TIMESTAMP WITH TIME ZONE" if _DIALECT == "pg" else "TIMESTAMP"
+
+
+def _pg_columns(conn, table_name: str) -> set[str]:
+    rows = conn.execute(
+        text(
+            """
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name = :table_name
+            """
+        ),
+        {"table_name": table_name},
+    ).fetchall()
+    return {row[0] for row in rows}
+
+
+def _sqlite_columns(conn, table_name: str) -> set[str]:
     rows = conn.execute(text(f'PRAGMA table_info("{table_name}")')).fetchall()
-    return any(row[1] == column_name for row in rows)
-
-
-def _index_exists(conn, table_name: str, index_name: str, url: str) -> bool:
-    if "postgres" in url:
-        row = conn.execute(
-            text(
-                """
-                SELECT 1
-                FROM pg_indexes
-                WHERE schemaname = current_schema()
-                  AND tablename = :table_name
-                  AND indexname = :index_name
-                LIMIT 1
-                """
-            ),
-            {"table_name": table_name, "index_name": index_name},
-        ).fetchone()
-        return row is not None
+    return {row[1] for row in rows}
+
+
+def _pg_indexes(conn, table_name: str) -> set[str]:
+    rows = conn.execute(
+        text(
+            """
+            SELECT indexname
+            FROM pg_indexes
+            WHERE schemaname = current_schema()
+              AND tablename = :table_name
+            """
+        ),
+        {"table_name": table_name},
+    ).fetchall()
+    return {row[0] for row in rows}
+
+
+def _sqlite_indexes(conn, table_name: str) -> set[str]:
     rows = conn.execute(text(f'PRAGMA index_list("{table_name}")')).fetchall()
-    return any(row[1] == index_name for row in rows)
+    return {row[1] for row in rows}
+
+
+_existing_columns: Callable[[Any, str], set[str]] = {"pg": _pg_columns, "sqlite": _sqlite_columns}[_DIALECT]
+_existing_indexes: Callable[[Any, str], set[str]] = {"pg": _pg_indexes, "sqlite": _sqlite_indexes}[_DIALECT]
+
+
+def _sync_indexes(
+    conn,
+    table_name: str,
+    *,
+    index_specs: list[tuple[str, str]],
+    legacy_index_names: list[str],
+) -> None:
+    """Drop superseded indexes and create missing ones from (name, definition) pairs."""
+    existing = _existing_indexes(conn, table_name)
+    for index_name in legacy_index_names:
+        if index_name in existing:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+    for index_name, index_definition in index_specs:
+        if index_name not in existing:
+            conn.execute(
+                text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} {index_definition}")
+            )
 
 
 def _run_runtime_migrations() -> None:
-    url = str(_engine.url)
     with _engine.begin() as conn:
         task_columns: list[tuple[str, str]] = [
             ("cancel_requested", "BOOLEAN DEFAULT FALSE"),
-            ("cancel_requested_at", "TIMESTAMP WITH TIME ZONE" if "postgres" in url else "TIMESTAMP"),
+            ("cancel_requested_at", _TS_TYPE),
             ("max_attempts", "INTEGER DEFAULT 3"),
             ("retry_base_seconds", "INTEGER"),
             ("retry_max_seconds", "INTEGER"),
             ("timeout_seconds", "INTEGER"),
-            ("next_run_at", "TIMESTAMP WITH TIME ZONE" if "postgres" in url else "TIMESTAMP"),
-            ("claimed_by", "VARCHAR(255)" if "postgres" in url else "TEXT"),
-            ("claimed_at", "TIMESTAMP WITH TIME ZONE" if "postgres" in url else "TIMESTAMP"),
-            ("lease_expires_at", "TIMESTAMP WITH TIME ZONE" if "postgres" in url else "TIMESTAMP"),
+            ("next_run_at", _TS_TYPE),
+            ("claimed_by", "VARCHAR(255)" if _DIALECT == "pg" else "TEXT"),
+            ("claimed_at", _TS_TYPE),
+            ("lease_expires_at", _TS_TYPE),
         ]
+        existing_task_columns = _existing_columns(conn, "tasks")
         for column_name, column_type in task_columns:
-            if not _column_exists(conn, "tasks", column_name, url):
+            if column_name not in existing_task_columns:
                 conn.execute(
                     text(f"ALTER TABLE tasks ADD COLUMN {column_name} {column_type}")
                 )
+        # (index name, column list and optional partial predicate)
         index_specs = [
-            ("ix_tasks_cancel_requested", "cancel_requested"),
-            ("ix_tasks_next_run_at", "next_run_at"),
-            ("ix_tasks_claimed_by", "claimed_by"),
-            ("ix_tasks_claimed_at", "claimed_at"),
-            ("ix_tasks_lease_expires_at", "lease_expires_at"),
+            ("ix_tasks_cancel_requested", "(cancel_requested)"),
+            ("ix_tasks_ticket", "(ticket_id, created_at)"),
+            ("ix_tasks_queue", "(state, next_run_at, created_at)"),
+            ("ix_tasks_runnable", "(created_at, next_run_at) WHERE state IN ('queued', 'retrying')"),
+            ("ix_tasks_lease_expired", "(lease_expires_at) WHERE state = 'running'"),
         ]
-        for index_name, column_name in index_specs:
-            if not _index_exists(conn, "tasks", index_name, url):
-                conn.execute(
-                    text(
-                        f"CREATE INDEX IF NOT EXISTS {index_name} ON tasks ({column_name})"
-                    )
-                )
+        # Single-column indexes superseded by the composite/partial indexes above.
+        legacy_index_names = [
+            "ix_tasks_state",
+            "ix_tasks_ticket_id",
+            "ix_tasks_next_run_at",
+            "ix_tasks_claimed_by",
+            "ix_tasks_claimed_at",
+            "ix_tasks_lease_expires_at",
+        ]
+        _sync_indexes(conn, "tasks", index_specs=index_specs, legacy_index_names=legacy_index_names)
 
         ticket_columns: list[tuple[str, str]] = [
             ("paused", "BOOLEAN DEFAULT FALSE"),
-            ("paused_at", "TIMESTAMP WITH TIME ZONE" if "postgres" in url else "TIMESTAMP"),
-            ("resumed_at", "TIMESTAMP WITH TIME ZONE" if "postgres" in url else "TIMESTAMP"),
+            ("paused_at", _TS_TYPE),
+            ("resumed_at", _TS_TYPE),
             ("approval_required", "BOOLEAN DEFAULT FALSE"),
-            ("approval_status", "VARCHAR(32) DEFAULT 'none'" if "postgres" in url else "TEXT DEFAULT 'none'"),
-            ("approval_requested_at", "TIMESTAMP WITH TIME ZONE" if "postgres" in url else "TIMESTAMP"),
-            ("approval_decided_at", "TIMESTAMP WITH TIME ZONE" if "postgres" in url else "TIMESTAMP"),
+            ("approval_status", "VARCHAR(32) DEFAULT 'none'" if _DIALECT == "pg" else "TEXT DEFAULT 'none'"),
+            ("approval_requested_at", _TS_TYPE),
+            ("approval_decided_at", _TS_TYPE),
             ("approval_notes", "TEXT"),
         ]
+        existing_ticket_columns = _existing_columns(conn, "tickets")
         for column_name, column_type in ticket_columns:
-            if not _column_exists(conn, "tickets", column_name, url):
+            if column_name not in existing_ticket_columns:
                 conn.execute(
                     text(f"ALTER TABLE tickets ADD COLUMN {column_name} {column_type}")
                 )
 
-        ticket_index_specs = [
-            ("ix_tickets_paused", "paused"),
-            ("ix_tickets_approval_required", "approval_required"),
-            ("ix_tickets_approval_status", "approval_status"),
-        ]
-        for index_name, column_name in ticket_index_specs:
-            if not _index_exists(conn, "tickets", index_name, url):
-                conn.execute(
-                    text(
-                        f"CREATE INDEX IF NOT EXISTS {index_name} ON tickets ({column_name})"
-                    )
-                )
+        _sync_indexes(
+            conn,
+            "tickets",
+            index_specs=[
+                ("ix_tickets_pending_approval", "(approval_requested_at) WHERE approval_status = 'pending'"),
+            ],
+            # Full boolean/status indexes replaced by the partial index above.
+            legacy_index_names=[
+                "ix_tickets_paused",
+                "ix_tickets_approval_required",
+                "ix_tickets_approval_status",
+            ],
+        )
+        _sync_indexes(
+            conn,
+            "ticket_events",
+            index_specs=[
+                ("ix_events_unconsumed", "(ticket_id, event_type, created_at) WHERE consumed_at IS NULL"),
+            ],
+            legacy_index_names=["ix_ticket_events_consumed_at"],
+        )
+        _sync_indexes(
+            conn,
+            "task_dependencies",
+            index_specs=[("ix_task_deps_task", "(task_id, depends_on_task_id)")],
+            legacy_index_names=["ix_task_dependencies_task_id"],
+        )
+        _sync_indexes(
+            conn,
+            "ticket_schedules",
+            index_specs=[("ix_ticket_schedules_due", "(active, next_run_at)")],
+            # Single-column indexes subsumed by the composite due index.
+            legacy_index_names=[
+                "ix_ticket_schedules_active",
+                "ix_ticket_schedules_next_run_at",
+            ],
+        )
 
 
 @contextmanager
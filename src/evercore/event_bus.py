@@ -0,0 +1,171 @@
+"""Ticket event and schedule wake-ups over PostgreSQL LISTEN/NOTIFY.
+
+Schedule changes also wake in-process waiters on other backends.
+"""
+
+from __future__ import annotations
+
+import json
+import select
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session
+
+from .db import _engine
+
+TICKET_EVENTS_CHANNEL = "evercore_ticket_events"
+SCHEDULES_CHANNEL = "evercore_schedules"
+
+_PENDING_LOCAL_EVENTS = "evercore_pending_local_wakeups"
+_local_lock = threading.Lock()
+_local_waiters: dict[tuple[str, str], threading.Event] = {}
+_local_waiter_counts: dict[tuple[str, str], int] = {}
+# Local waiter key for schedule changes; ticket ids never equal the channel name.
+_SCHEDULES_KEY = (SCHEDULES_CHANNEL, "")
+
+
+def _is_postgres(session: Session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def notify_ticket_event(session: Session, *, ticket_id: str, event_type: str) -> None:
+    """NOTIFY listeners of a published ticket event on PostgreSQL; delivered on commit."""
+    if not _is_postgres(session):
+        return
+    session.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {
+            "channel": TICKET_EVENTS_CHANNEL,
+            "payload": json.dumps({"ticket_id": ticket_id, "event_type": event_type}),
+        },
+    )
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _wake_local_waiters(session: OrmSession) -> None:
+    keys = session.info.pop(_PENDING_LOCAL_EVENTS, None)
+    if not keys:
+        return
+    with _local_lock:
+        for key in keys:
+            waiter = _local_waiters.pop(key, None)
+            if waiter is not None:
+                waiter.set()
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _drop_pending_local_events(session: OrmSession) -> None:
+    session.info.pop(_PENDING_LOCAL_EVENTS, None)
+
+
+def _wait_local(key: tuple[str, str], timeout_seconds: float) -> bool:
+    # Waiters on the same key share one Event, so a single publish wakes them all.
+    with _local_lock:
+        waiter = _local_waiters.setdefault(key, threading.Event())
+        _local_waiter_counts[key] = _local_waiter_counts.get(key, 0) + 1
+    try:
+        return waiter.wait(timeout_seconds)
+    finally:
+        with _local_lock:
+            remaining = _local_waiter_counts.pop(key) - 1
+            if remaining:
+                _local_waiter_counts[key] = remaining
+            else:
+                _local_waiters.pop(key, None)
+
+
+def _matches(payload: str, ticket_id: str, event_type: str) -> bool:
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return False
+    return data.get("ticket_id") == ticket_id and data.get("event_type") == event_type
+
+
+def can_listen_for_ticket_events() -> bool:
+    """Whether ticket event publishes reach other processes (PostgreSQL only)."""
+    return _engine.dialect.name == "postgresql"
+
+
+@contextmanager
+def listen_for_ticket_event(*, ticket_id: str, event_type: str) -> Iterator[Callable[[float], bool]]:
+    """LISTEN for a matching publish; yields `wait(timeout_seconds) -> bool`.
+
+    Enter this before checking the events table: a publish committed between
+    the check and `wait` is then still delivered instead of waiting out the
+    timeout. PostgreSQL only; see can_listen_for_ticket_events.
+    """
+    with _listening(TICKET_EVENTS_CHANNEL) as wait:
+        yield lambda timeout_seconds: wait(
+            lambda payload: _matches(payload, ticket_id, event_type),
+            timeout_seconds,
+        )
+
+
+def notify_schedules_changed(session: Session) -> None:
+    """Wake scheduler loops after a schedule's next_run_at was set; fires on commit."""
+    session.info.setdefault(_PENDING_LOCAL_EVENTS, set()).add(_SCHEDULES_KEY)
+    if _is_postgres(session):
+        session.execute(text(f"NOTIFY {SCHEDULES_CHANNEL}"))
+
+
+def wait_for_schedule_change(timeout_seconds: float) -> bool:
+    """Block up to `timeout_seconds` for a schedule create/resume.
+
+    PostgreSQL LISTENs, so it sees every process; other backends only wake
+    for changes committed by this process.
+    """
+    if timeout_seconds <= 0:
+        return False
+    if _engine.dialect.name != "postgresql":
+        return _wait_local(_SCHEDULES_KEY, timeout_seconds)
+    with _listening(SCHEDULES_CHANNEL) as wait:
+        return wait(lambda payload: True, timeout_seconds)
+
+
+@contextmanager
+def _listening(channel: str) -> Iterator[Callable[[Callable[[str], bool], float], bool]]:
+    raw = _engine.raw_connection()
+    conn = raw.driver_connection
+    previous_autocommit = conn.autocommit
+    try:
+        conn.autocommit = True
+        conn.cursor().execute(f"LISTEN {channel}")
+        yield lambda accept, timeout_seconds: _wait_notify(conn, accept, timeout_seconds)
+    finally:
+        try:
+            conn.cursor().execute(f"UNLISTEN {channel}")
+            conn.autocommit = previous_autocommit
+        finally:
+            raw.close()
+
+
+def _wait_notify(conn, accept: Callable[[str], bool], timeout_seconds: float) -> bool:
+    # Notifications that arrived since LISTEN sit unread on the socket, so they
+    # are still seen here.
+    if timeout_seconds <= 0:
+        return False
+    deadline = time.monotonic() + timeout_seconds
+    if hasattr(conn, "poll"):
+        # psycopg2: wait on the socket, then drain conn.notifies.
+        while True:
+            conn.poll()
+            notifies = list(conn.notifies)
+            conn.notifies.clear()
+            if any(accept(item.payload) for item in notifies):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([conn], [], [], remaining)[0]:
+                return False
+    # psycopg 3
+    for item in conn.notifies(timeout=timeout_seconds):
+        if accept(item.payload):
+            return True
+        if time.monotonic() >= deadline:
+            break
+    return False
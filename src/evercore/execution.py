@@ -4,16 +4,20 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from .models import Task, Ticket
 
+# Shared read-only default so results without output do not each allocate a dict.
+_EMPTY_OUTPUT: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ExecutionResult:
     success: bool
     message: str = ""
-    output: dict[str, Any] = field(default_factory=dict)
+    output: Mapping[str, Any] = field(default=_EMPTY_OUTPUT)
     defer: bool = False
     defer_seconds: int | None = None
     terminal_failure: bool = False
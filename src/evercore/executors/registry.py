@@ -2,41 +2,98 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping
 
 from evercore.db import get_session
-from evercore.agent_runtime import LemlemAgentRuntime
+from evercore.agent_runtime import AgentRuntimeResult, LemlemAgentRuntime
+from evercore.event_bus import can_listen_for_ticket_events, listen_for_ticket_event
 from evercore.execution import ExecutionResult, TaskExecutor
+from evercore.llm_cache import (
+    ResponseCache,
+    SemanticResponseCache,
+    is_cacheable_temperature,
+    response_cache_key,
+)
 from evercore.models import Task, Ticket
-from evercore.repositories import get_unconsumed_ticket_event
+from evercore.repositories import consume_ticket_event, get_unconsumed_ticket_event
 from evercore.time_utils import now_utc
 from evercore.settings import settings
 
+# Executors only read task payloads; share one read-only empty mapping
+# instead of copying the ORM dict on every dispatch.
+_EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
+# Identical for every ticket so providers can reuse it as a cached prefix; the
+# ticket id travels in the user message instead.
+_DEFAULT_SYSTEM_PROMPT = "You are working on a ticket."
+
+
+def _run_cached(
+    cache: ResponseCache | None,
+    kind: str,
+    request: dict[str, Any],
+    call: Callable[..., AgentRuntimeResult],
+) -> AgentRuntimeResult:
+    if cache is None or not is_cacheable_temperature(request.get("temperature")):
+        return call(**request)
+    key = response_cache_key(kind=kind, **request)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    result = call(**request)
+    if result.success:
+        cache.set(key, result)
+    return result
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_lemlem() -> tuple[LemlemAgentRuntime, ResponseCache]:
+    return LemlemAgentRuntime(), ResponseCache()
+
+
+def shared_agent_runtime() -> LemlemAgentRuntime:
+    """The process-wide runtime the default executors use."""
+    return _shared_lemlem()[0]
+
 
 class NoopExecutor(TaskExecutor):
     def execute(self, ticket: Ticket, task: Task) -> ExecutionResult:
         del ticket
-        return ExecutionResult(success=True, message="noop task completed", output={})
+        return ExecutionResult(success=True, message="noop task completed")
 
 
 class LemlemPromptExecutor(TaskExecutor):
-    def __init__(self, runtime: LemlemAgentRuntime):
+    def __init__(
+        self,
+        runtime: LemlemAgentRuntime,
+        cache: ResponseCache | None = None,
+        semantic_cache: SemanticResponseCache | None = None,
+    ):
         self.runtime = runtime
+        self.cache = cache
+        self.semantic_cache = semantic_cache
 
     def execute(self, ticket: Ticket, task: Task) -> ExecutionResult:
-        payload = dict(task.payload or {})
+        payload = task.payload or _EMPTY_PAYLOAD
         prompt = str(payload.get("prompt") or "").strip()
         if not prompt:
             return ExecutionResult(success=False, message="lemlem_prompt requires payload.prompt")
 
-        result = self.runtime.run_prompt(
-            prompt=prompt,
-            model=payload.get("model"),
-            system_prompt=payload.get("system_prompt") or f"You are working on ticket {ticket.ticket_id}.",
-            temperature=payload.get("temperature"),
-        )
+        system_prompt = payload.get("system_prompt")
+        if not system_prompt:
+            system_prompt = _DEFAULT_SYSTEM_PROMPT
+            prompt = f"Ticket: {ticket.ticket_id}\n\n{prompt}"
+        request = {
+            "prompt": prompt,
+            "model": payload.get("model"),
+            "system_prompt": system_prompt,
+            "temperature": payload.get("temperature"),
+        }
+        result = self._run(request)
         if not result.success:
             return ExecutionResult(success=False, message=result.error or "lemlem prompt failed")
 
@@ -51,13 +108,29 @@ class LemlemPromptExecutor(TaskExecutor):
             },
         )
 
+    def _run(self, request: dict[str, Any]) -> AgentRuntimeResult:
+        if self.semantic_cache is None or not is_cacheable_temperature(request.get("temperature")):
+            return _run_cached(self.cache, "prompt", request, self.runtime.run_prompt)
+
+        model = str(request.get("model") or "")
+        vector, similar = self.semantic_cache.lookup(
+            model, f"{request['system_prompt']}\n\n{request['prompt']}"
+        )
+        if similar is not None:
+            return similar
+        result = _run_cached(self.cache, "prompt", request, self.runtime.run_prompt)
+        if result.success:
+            self.semantic_cache.add(model, vector, result)
+        return result
+
 
 class LemlemAgentJsonExecutor(TaskExecutor):
-    def __init__(self, runtime: LemlemAgentRuntime):
+    def __init__(self, runtime: LemlemAgentRuntime, cache: ResponseCache | None = None):
         self.runtime = runtime
+        self.cache = cache
 
     def execute(self, ticket: Ticket, task: Task) -> ExecutionResult:
-        payload = dict(task.payload or {})
+        payload = task.payload or _EMPTY_PAYLOAD
         system_prompt = str(payload.get("system_prompt") or "").strip()
         user_payload = payload.get("user_payload") or {}
         if not system_prompt:
@@ -65,18 +138,19 @@ class LemlemAgentJsonExecutor(TaskExecutor):
         if not isinstance(user_payload, dict):
             return ExecutionResult(success=False, message="payload.user_payload must be an object")
 
-        runtime_result = self.runtime.run_agent_json(
-            model=payload.get("model"),
-            system_prompt=system_prompt,
-            payload={
+        request = {
+            "model": payload.get("model"),
+            "system_prompt": system_prompt,
+            "payload": {
                 "ticket_id": ticket.ticket_id,
                 "ticket_stage": ticket.stage,
                 "ticket_context": ticket.context_data,
                 "task_payload": user_payload,
             },
-            temperature=payload.get("temperature"),
-            max_tool_iterations=int(payload.get("max_tool_iterations") or 6),
-        )
+            "temperature": payload.get("temperature"),
+            "max_tool_iterations": int(payload.get("max_tool_iterations") or 6),
+        }
+        runtime_result = _run_cached(self.cache, "agent_json", request, self.runtime.run_agent_json)
         if not runtime_result.success:
             return ExecutionResult(success=False, message=runtime_result.error or "lemlem agent json failed")
 
@@ -94,7 +168,7 @@ class LemlemAgentJsonExecutor(TaskExecutor):
 
 class WaitForEventExecutor(TaskExecutor):
     def execute(self, ticket: Ticket, task: Task) -> ExecutionResult:
-        payload = dict(task.payload or {})
+        payload = task.payload or _EMPTY_PAYLOAD
         event_type = str(payload.get("event_type") or "").strip()
         if not event_type:
             return ExecutionResult(
@@ -106,34 +180,19 @@ class WaitForEventExecutor(TaskExecutor):
         consume = bool(payload.get("consume", True))
         defer_seconds = int(payload.get("poll_interval_seconds") or settings.event_wait_poll_interval_seconds)
 
-        session = get_session()
-        try:
-            row = get_unconsumed_ticket_event(
-                session,
-                ticket_id=ticket.ticket_id,
-                event_type=event_type,
-            )
-            if row is not None:
-                if consume:
-                    row.consumed_at = now_utc()
-                    row.consumed_by_task_id = task.id
-                    session.add(row)
-                    session.commit()
-                else:
-                    session.rollback()
-                return ExecutionResult(
-                    success=True,
-                    message=f"received event '{event_type}'",
-                    output={
-                        "event_id": row.id,
-                        "event_type": row.event_type,
-                        "payload": row.payload,
-                        "created_at": row.created_at.isoformat(),
-                    },
-                )
-            session.rollback()
-        finally:
-            session.close()
+        listen_seconds = min(float(max(1, defer_seconds)), settings.event_wait_listen_seconds)
+        if listen_seconds > 0 and can_listen_for_ticket_events():
+            # LISTEN first so a publish racing the table check still wakes us.
+            with listen_for_ticket_event(ticket_id=ticket.ticket_id, event_type=event_type) as wait:
+                received = self._receive(ticket, task, event_type, consume)
+                if received is None and wait(listen_seconds):
+                    received = self._receive(ticket, task, event_type, consume)
+        else:
+            # Without NOTIFY nothing from other processes can wake a wait, so
+            # free the worker and rely on the deferred re-poll.
+            received = self._receive(ticket, task, event_type, consume)
+        if received is not None:
+            return received
 
         if timeout_seconds is not None:
             started_at = task.created_at or now_utc()
@@ -154,6 +213,40 @@ class WaitForEventExecutor(TaskExecutor):
             output={"event_type": event_type},
         )
 
+    @staticmethod
+    def _receive(ticket: Ticket, task: Task, event_type: str, consume: bool) -> ExecutionResult | None:
+        session = get_session()
+        try:
+            row = get_unconsumed_ticket_event(
+                session,
+                ticket_id=ticket.ticket_id,
+                event_type=event_type,
+            )
+            if row is None:
+                session.rollback()
+                return None
+            if consume:
+                row = consume_ticket_event(session, event_id=row.id, task_id=task.id)
+                session.commit()
+                if row is None:
+                    return None
+            else:
+                session.rollback()
+            return ExecutionResult(
+                success=True,
+                message=f"received event '{event_type}'",
+                output={
+                    "event_id": row.id,
+                    "event_type": row.event_type,
+                    "payload": row.payload,
+                    "created_at": row.created_at.isoformat(),
+                },
+            )
+        finally:
+            # Drop ORM references before returning the connection; waits poll often.
+            session.expunge_all()
+            session.close()
+
 
 @dataclass
 class ExecutorRegistry:
@@ -161,12 +254,13 @@ class ExecutorRegistry:
 
     @classmethod
     def default(cls) -> "ExecutorRegistry":
-        runtime = LemlemAgentRuntime()
+        # Fresh mapping so register() stays local, but one runtime/cache per process.
+        runtime, cache = _shared_lemlem()
         return cls(
             executors={
                 "noop": NoopExecutor(),
-                "lemlem_prompt": LemlemPromptExecutor(runtime),
-                "lemlem_agent_json": LemlemAgentJsonExecutor(runtime),
+                "lemlem_prompt": LemlemPromptExecutor(runtime, cache=cache),
+                "lemlem_agent_json": LemlemAgentJsonExecutor(runtime, cache=cache),
                 "wait_for_event": WaitForEventExecutor(),
             }
         )
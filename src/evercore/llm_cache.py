@@ -0,0 +1,120 @@
+"""In-process response cache for deterministic lemlem calls."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Optional, Sequence
+
+from .agent_runtime import AgentRuntimeResult
+from .settings import settings
+
+
+def is_cacheable_temperature(temperature: Any) -> bool:
+    # Sampled outputs are not reproducible, so only cache explicit greedy decoding;
+    # an unset temperature means the provider's default, which usually samples.
+    if temperature is None:
+        return False
+    try:
+        return float(temperature) == 0.0
+    except (TypeError, ValueError):
+        return False
+
+
+def _copy_result(value: AgentRuntimeResult) -> AgentRuntimeResult:
+    # Results carry mutable usage/raw dicts; never hand the cached instance out.
+    return copy.deepcopy(value)
+
+
+def response_cache_key(**parts: Any) -> str:
+    encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe LRU of successful runtime results with a per-entry TTL."""
+
+    def __init__(self, maxsize: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self.maxsize = max(int(settings.llm_cache_size if maxsize is None else maxsize), 0)
+        self.ttl_seconds = float(settings.llm_cache_ttl_seconds if ttl_seconds is None else ttl_seconds)
+        self._entries: OrderedDict[str, tuple[float, AgentRuntimeResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> AgentRuntimeResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return _copy_result(value)
+
+    def set(self, key: str, value: AgentRuntimeResult, ttl: Optional[float] = None) -> None:
+        if self.maxsize == 0:
+            return
+        expires_at = time.monotonic() + (self.ttl_seconds if ttl is None else float(ttl))
+        value = _copy_result(value)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _normalize(vector: Sequence[float]) -> list[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0.0:
+        return [0.0 for _ in vector]
+    return [value / norm for value in vector]
+
+
+class SemanticResponseCache:
+    """Nearest-neighbour cache over prompt embeddings produced by a host-supplied `embed`.
+
+    Evercore ships no embedding model; apps that have one pass it in to let
+    paraphrased prompts reuse a cached response when cosine similarity is at
+    least `threshold`. Entries are partitioned by model and scanned linearly,
+    which is adequate for the few hundred entries this is sized for.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        threshold: Optional[float] = None,
+        maxsize: Optional[int] = None,
+    ):
+        self.embed = embed
+        self.threshold = float(settings.llm_semantic_threshold if threshold is None else threshold)
+        self.maxsize = max(int(settings.llm_semantic_cache_size if maxsize is None else maxsize), 1)
+        self._entries: dict[str, deque[tuple[list[float], AgentRuntimeResult]]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, model: str, text: str) -> tuple[list[float], AgentRuntimeResult | None]:
+        """Return the query embedding and the best cached result above threshold, if any."""
+        vector = _normalize(self.embed(text))
+        best_score = self.threshold
+        best: AgentRuntimeResult | None = None
+        with self._lock:
+            for candidate, value in self._entries.get(model, ()):
+                score = sum(a * b for a, b in zip(candidate, vector))
+                if score >= best_score:
+                    best_score = score
+                    best = value
+        return vector, (_copy_result(best) if best is not None else None)
+
+    def add(self, model: str, vector: list[float], value: AgentRuntimeResult) -> None:
+        with self._lock:
+            entries = self._entries.setdefault(model, deque(maxlen=self.maxsize))
+            entries.append((vector, _copy_result(value)))
@@ -0,0 +1,20 @@
+"""One-shot schema setup for standalone evercore."""
+
+from __future__ import annotations
+
+import logging
+
+from evercore.db import create_db_and_tables
+from evercore.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    create_db_and_tables()
+    logger.info("evercore schema is up to date: %s", settings.database_url)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Optional, Dict
 
-from sqlalchemy import Column, JSON, Text
+from sqlalchemy import Column, Index, JSON, Text, text
+from sqlalchemy.orm import relationship
 from sqlmodel import Field, SQLModel
 
 from .time_utils import now_utc
@@ -13,6 +14,15 @@ from .time_utils import now_utc
 
 class Ticket(SQLModel, table=True):
     __tablename__ = "tickets"
+    __table_args__ = (
+        # Approval queue; tickets outside the pending state are not indexed.
+        Index(
+            "ix_tickets_pending_approval",
+            "approval_requested_at",
+            sqlite_where=text("approval_status = 'pending'"),
+            postgresql_where=text("approval_status = 'pending'"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     ticket_id: str = Field(index=True, unique=True)
@@ -22,11 +32,11 @@ class Ticket(SQLModel, table=True):
     workflow_input: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
     stage: str = Field(default="queued", index=True)
     status: str = Field(default="active", index=True)
-    paused: bool = Field(default=False, index=True)
+    paused: bool = Field(default=False)
     paused_at: Optional[datetime] = Field(default=None)
     resumed_at: Optional[datetime] = Field(default=None)
-    approval_required: bool = Field(default=False, index=True)
-    approval_status: str = Field(default="none", index=True)
+    approval_required: bool = Field(default=False)
+    approval_status: str = Field(default="none")
     approval_requested_at: Optional[datetime] = Field(default=None)
     approval_decided_at: Optional[datetime] = Field(default=None)
     approval_notes: Optional[str] = Field(default=None, sa_column=Column(Text))
@@ -39,11 +49,34 @@ class Ticket(SQLModel, table=True):
 
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Per-ticket task lists in creation order (every ticket lifecycle method);
+        # the ticket_id prefix also serves plain ticket_id filters.
+        Index("ix_tasks_ticket", "ticket_id", "created_at"),
+        # Queue scan by state regardless of how the driver binds the IN list;
+        # also serves plain state filters, so it replaces a state-only index.
+        Index("ix_tasks_queue", "state", "next_run_at", "created_at"),
+        # Worker claim scan: runnable states in FIFO order, gated by next_run_at.
+        Index(
+            "ix_tasks_runnable",
+            "created_at",
+            "next_run_at",
+            sqlite_where=text("state IN ('queued', 'retrying')"),
+            postgresql_where=text("state IN ('queued', 'retrying')"),
+        ),
+        # Stale-lease reaper scan over running tasks only.
+        Index(
+            "ix_tasks_lease_expired",
+            "lease_expires_at",
+            sqlite_where=text("state = 'running'"),
+            postgresql_where=text("state = 'running'"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    ticket_id: str = Field(index=True, foreign_key="tickets.ticket_id")
+    ticket_id: str = Field(foreign_key="tickets.ticket_id")
     task_key: str = Field(index=True)
-    state: str = Field(default="queued", index=True)
+    state: str = Field(default="queued")
     payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
     result_data: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
     error_message: Optional[str] = Field(default=None, sa_column=Column(Text))
@@ -54,10 +87,10 @@ class Task(SQLModel, table=True):
     retry_base_seconds: Optional[int] = Field(default=None)
     retry_max_seconds: Optional[int] = Field(default=None)
     timeout_seconds: Optional[int] = Field(default=None)
-    next_run_at: Optional[datetime] = Field(default=None, index=True)
-    claimed_by: Optional[str] = Field(default=None, index=True)
-    claimed_at: Optional[datetime] = Field(default=None, index=True)
-    lease_expires_at: Optional[datetime] = Field(default=None, index=True)
+    next_run_at: Optional[datetime] = Field(default=None)
+    claimed_by: Optional[str] = Field(default=None)
+    claimed_at: Optional[datetime] = Field(default=None)
+    lease_expires_at: Optional[datetime] = Field(default=None)
     created_at: datetime = Field(default_factory=now_utc)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -66,9 +99,14 @@ class Task(SQLModel, table=True):
 
 class TaskDependency(SQLModel, table=True):
     __tablename__ = "task_dependencies"
+    __table_args__ = (
+        # Claim-time NOT EXISTS probe per candidate task, answered from the index alone;
+        # the task_id prefix also serves list_dependencies.
+        Index("ix_task_deps_task", "task_id", "depends_on_task_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    task_id: int = Field(index=True, foreign_key="tasks.id")
+    task_id: int = Field(foreign_key="tasks.id")
     depends_on_task_id: int = Field(index=True, foreign_key="tasks.id")
     created_at: datetime = Field(default_factory=now_utc)
 
@@ -97,23 +135,38 @@ class WorkerHeartbeat(SQLModel, table=True):
 
 class TicketEvent(SQLModel, table=True):
     __tablename__ = "ticket_events"
+    __table_args__ = (
+        # Oldest unconsumed event lookup for wait_for_event.
+        Index(
+            "ix_events_unconsumed",
+            "ticket_id",
+            "event_type",
+            "created_at",
+            sqlite_where=text("consumed_at IS NULL"),
+            postgresql_where=text("consumed_at IS NULL"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     ticket_id: str = Field(index=True, foreign_key="tickets.ticket_id")
     event_type: str = Field(index=True)
     payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
-    consumed_at: Optional[datetime] = Field(default=None, index=True)
+    consumed_at: Optional[datetime] = Field(default=None)
     consumed_by_task_id: Optional[int] = Field(default=None, index=True)
     created_at: datetime = Field(default_factory=now_utc, index=True)
 
 
 class TicketSchedule(SQLModel, table=True):
     __tablename__ = "ticket_schedules"
+    __table_args__ = (
+        # Due-schedule poll: range scan on active rows, already ordered by next_run_at.
+        Index("ix_ticket_schedules_due", "active", "next_run_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     schedule_key: str = Field(index=True, unique=True)
-    active: bool = Field(default=True, index=True)
-    next_run_at: Optional[datetime] = Field(default=None, index=True)
+    active: bool = Field(default=True)
+    next_run_at: Optional[datetime] = Field(default=None)
     interval_seconds: Optional[int] = Field(default=None)
     ticket_title: Optional[str] = None
     workflow_key: Optional[str] = Field(default=None, index=True)
@@ -127,3 +180,18 @@ class TicketSchedule(SQLModel, table=True):
     last_run_at: Optional[datetime] = Field(default=None)
     created_at: datetime = Field(default_factory=now_utc)
     updated_at: datetime = Field(default_factory=now_utc)
+
+
+# Read-only Ticket.tasks for eager loading (selectinload) on list pages. Mapped
+# imperatively because SQLModel cannot resolve Relationship annotations under
+# postponed evaluation; writes still go through Task.ticket_id.
+Ticket.__mapper__.add_property(
+    "tasks",
+    relationship(
+        Task,
+        primaryjoin=Ticket.ticket_id == Task.ticket_id,
+        foreign_keys=[Task.ticket_id],
+        order_by=Task.created_at,
+        viewonly=True,
+    ),
+)
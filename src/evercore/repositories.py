@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Iterator, Mapping, Optional
 
-from sqlalchemy import or_
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, bindparam, case, event, exists, func, insert, literal, or_, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import aliased, selectinload
 from sqlmodel import Session, select
 
+from .event_bus import notify_ticket_event
 from .models import (
     Task,
     TaskDependency,
@@ -16,16 +25,93 @@ from .models import (
     TicketSchedule,
     WorkerHeartbeat,
 )
-from .time_utils import now_utc
+from .time_utils import coerce_utc, now_utc
 
+# Hot lookup built once; callers bind ticket_id per execution.
+_SELECT_TICKET_BY_TICKET_ID = select(Ticket).where(Ticket.ticket_id == bindparam("ticket_id"))
+
+
+# ticket_id -> primary key. The mapping never changes for a live row, so no TTL is
+# needed; hits resolve through Session.get, which skips SQL when the ticket is
+# already in the caller's identity map. Stale ids (deleted or rolled back rows)
+# fail the ticket_id check below and fall through to the SELECT.
+_TICKET_PK_CACHE_SIZE = 1024
+_ticket_pk_cache: OrderedDict[str, int] = OrderedDict()
+_ticket_pk_lock = threading.Lock()
+
+
+def _remember_ticket_pk(ticket_id: str, pk: int) -> None:
+    with _ticket_pk_lock:
+        _ticket_pk_cache[ticket_id] = pk
+        _ticket_pk_cache.move_to_end(ticket_id)
+        while len(_ticket_pk_cache) > _TICKET_PK_CACHE_SIZE:
+            _ticket_pk_cache.popitem(last=False)
 
-def get_ticket_by_ticket_id(session: Session, ticket_id: str) -> Optional[Ticket]:
-    statement = select(Ticket).where(Ticket.ticket_id == ticket_id)
-    return session.exec(statement).first()
 
+@event.listens_for(Ticket, "after_insert")
+def _remember_inserted_ticket_pk(mapper, connection, target: Ticket) -> None:
+    del mapper, connection
+    _remember_ticket_pk(target.ticket_id, target.id)
 
-def list_tickets(session: Session, limit: int = 100) -> list[Ticket]:
-    statement = select(Ticket).order_by(Ticket.created_at.desc()).limit(limit)
+
+@event.listens_for(Ticket, "after_delete")
+def _forget_ticket_pk(mapper, connection, target: Ticket) -> None:
+    del mapper, connection
+    with _ticket_pk_lock:
+        _ticket_pk_cache.pop(target.ticket_id, None)
+
+
+def get_ticket_by_ticket_id(session: Session, ticket_id: str) -> Optional[Ticket]:
+    pk = _ticket_pk_cache.get(ticket_id)
+    if pk is not None:
+        # session.get answers from the identity map when the ticket is already loaded.
+        ticket = session.get(Ticket, pk)
+        if ticket is not None and ticket.ticket_id == ticket_id:
+            return ticket
+    ticket = session.exec(_SELECT_TICKET_BY_TICKET_ID, params={"ticket_id": ticket_id}).first()
+    if ticket is not None and ticket.id is not None:
+        _remember_ticket_pk(ticket_id, ticket.id)
+    return ticket
+
+
+def list_tickets_by_ticket_ids(session: Session, ticket_ids: Iterable[str]) -> list[Ticket]:
+    ids = list(ticket_ids)
+    if not ids:
+        return []
+    return list(session.exec(select(Ticket).where(Ticket.ticket_id.in_(ids))).all())
+
+
+def _keyset_filter(created_at_column, id_column, cursor: tuple[datetime, int | None], *, descending: bool):
+    """Rows strictly past `cursor` in (created_at, id) order.
+
+    created_at is not unique, so the id breaks ties; without an id only the
+    timestamp is compared, which may skip rows sharing the boundary timestamp.
+    """
+    created_at, row_id = coerce_utc(cursor[0]), cursor[1]
+    if row_id is None:
+        return created_at_column < created_at if descending else created_at_column > created_at
+    columns = tuple_(created_at_column, id_column)
+    bound = tuple_(created_at, row_id)
+    return columns < bound if descending else columns > bound
+
+
+def list_tickets(
+    session: Session,
+    limit: int = 100,
+    *,
+    cursor: tuple[datetime, int | None] | None = None,
+    eager: bool = False,
+) -> list[Ticket]:
+    """Newest tickets first; pass the last row's `(created_at, id)` as `cursor` for the next page.
+
+    With `eager`, each ticket's `tasks` are loaded by one follow-up IN query.
+    """
+    statement = select(Ticket)
+    if eager:
+        statement = statement.options(selectinload(Ticket.tasks))
+    if cursor is not None:
+        statement = statement.where(_keyset_filter(Ticket.created_at, Ticket.id, cursor, descending=True))
+    statement = statement.order_by(Ticket.created_at.desc(), Ticket.id.desc()).limit(limit)
     return list(session.exec(statement).all())
 
 
@@ -34,10 +120,53 @@ def list_tasks_for_ticket(session: Session, ticket_id: str) -> list[Task]:
     return list(session.exec(statement).all())
 
 
+def list_tasks_for_tickets(session: Session, ticket_ids: list[str]) -> dict[str, list[Task]]:
+    """Tasks for many tickets in one IN query, bucketed by ticket_id in creation order."""
+    tasks_by_ticket: dict[str, list[Task]] = {ticket_id: [] for ticket_id in ticket_ids}
+    if not tasks_by_ticket:
+        return tasks_by_ticket
+    statement = (
+        select(Task)
+        .where(Task.ticket_id.in_(list(tasks_by_ticket)))
+        .order_by(Task.created_at.asc())
+    )
+    for task in session.exec(statement).all():
+        tasks_by_ticket[task.ticket_id].append(task)
+    return tasks_by_ticket
+
+
+def update_ticket_tasks(
+    session: Session,
+    ticket_id: str,
+    *,
+    states: Iterable[str],
+    values: dict[str, Any],
+) -> int:
+    """Set `values` on every task of a ticket in `states` with one UPDATE; returns the row count.
+
+    Tasks already loaded in the session are synchronized with the new values.
+    """
+    statement = (
+        update(Task)
+        .where(Task.ticket_id == ticket_id, Task.state.in_(list(states)))
+        .values(**values)
+    )
+    return session.execute(statement).rowcount
+
+
 def add_task_dependencies(session: Session, task_id: int, depends_on_task_ids: list[int]) -> None:
-    for depends_on_task_id in depends_on_task_ids:
-        dependency = TaskDependency(task_id=task_id, depends_on_task_id=depends_on_task_id)
-        session.add(dependency)
+    if not depends_on_task_ids:
+        return
+    # One executemany INSERT; no ORM objects or unit-of-work bookkeeping per edge.
+    created_at = now_utc()
+    session.execute(
+        insert(TaskDependency),
+        [
+            {"task_id": task_id, "depends_on_task_id": depends_on_task_id, "created_at": created_at}
+            # Repeated ids would only add redundant edges to the claim-time NOT EXISTS scan.
+            for depends_on_task_id in dict.fromkeys(depends_on_task_ids)
+        ],
+    )
 
 
 def list_dependencies(session: Session, task_id: int) -> list[TaskDependency]:
@@ -56,28 +185,198 @@ def list_queued_tasks(session: Session) -> list[Task]:
     return list(session.exec(statement).all())
 
 
-def get_task(session: Session, task_id: int) -> Optional[Task]:
-    statement = select(Task).where(Task.id == task_id)
-    return session.exec(statement).first()
+def claim_tasks(
+    session: Session,
+    worker_id: str,
+    *,
+    batch_size: int = 1,
+    lease_seconds: int,
+    default_max_attempts: int,
+) -> list[Task]:
+    """Atomically mark up to `batch_size` runnable tasks as running for `worker_id`.
+
+    Runnable means queued/retrying, due, not cancel-requested, every dependency
+    completed, and the ticket neither paused nor awaiting approval. Postgres
+    takes row locks with SKIP LOCKED so concurrent workers claim disjoint rows;
+    SQLite serializes the single UPDATE on its write lock.
+    """
+    now = now_utc()
+    parent = aliased(Task)
+    ticket_blocked = exists().where(
+        Ticket.ticket_id == Task.ticket_id,
+        or_(
+            Ticket.paused.is_(True),
+            and_(Ticket.approval_required.is_(True), Ticket.approval_status == "pending"),
+        ),
+    )
+    dependency_unmet = exists(
+        select(TaskDependency.id)
+        .outerjoin(parent, parent.id == TaskDependency.depends_on_task_id)
+        .where(TaskDependency.task_id == Task.id)
+        .where(or_(parent.id.is_(None), parent.state != "completed"))
+    )
+    candidate_ids = (
+        select(Task.id)
+        .where(Task.state.in_(["queued", "retrying"]))
+        .where(or_(Task.next_run_at.is_(None), Task.next_run_at <= now))
+        .where(or_(Task.cancel_requested.is_(None), Task.cancel_requested.is_(False)))
+        .where(~ticket_blocked)
+        .where(~dependency_unmet)
+        .order_by(Task.created_at.asc())
+        .limit(max(int(batch_size), 1))
+        .with_for_update(skip_locked=True)
+    )
+    statement = (
+        update(Task)
+        .where(Task.id.in_(candidate_ids.scalar_subquery()))
+        .values(
+            state="running",
+            attempt_count=func.coalesce(Task.attempt_count, 0) + 1,
+            max_attempts=case(
+                (Task.max_attempts.is_(None), max(int(default_max_attempts or 1), 1)),
+                (Task.max_attempts < 1, 1),
+                else_=Task.max_attempts,
+            ),
+            started_at=now,
+            updated_at=now,
+            next_run_at=None,
+            claimed_by=worker_id,
+            claimed_at=now,
+            lease_expires_at=now + timedelta(seconds=max(int(lease_seconds), 1)),
+        )
+        .returning(Task)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    claimed = list(session.scalars(statement).all())
+    claimed.sort(key=lambda task: task.created_at)
+    return claimed
 
 
-def update_heartbeat(session: Session, worker_id: str, state: str, current_task_id: int | None) -> None:
-    statement = select(WorkerHeartbeat).where(WorkerHeartbeat.worker_id == worker_id)
-    row = session.exec(statement).first()
-    if row is None:
-        row = WorkerHeartbeat(
-            worker_id=worker_id,
-            state=state,
-            current_task_id=current_task_id,
-            last_seen_at=now_utc(),
+def park_held_ticket_tasks(session: Session) -> list[Row]:
+    """Park runnable tasks whose ticket is paused or awaiting approval.
+
+    claim_tasks already skips these; this moves them to `paused` (paused
+    ticket, checked first) or `blocked` (pending approval) so resume_ticket and
+    approve_ticket requeue them. Returns `(id, state)` rows for the parked tasks.
+    """
+    now = now_utc()
+    runnable = (
+        select(Task.id)
+        .where(Task.state.in_(["queued", "retrying"]))
+        .where(or_(Task.cancel_requested.is_(None), Task.cancel_requested.is_(False)))
+    )
+    holds = (
+        ("paused", Ticket.paused.is_(True)),
+        ("blocked", and_(Ticket.approval_required.is_(True), Ticket.approval_status == "pending")),
+    )
+    parked: list[Row] = []
+    for state, ticket_held in holds:
+        held_ids = (
+            runnable.where(exists().where(Ticket.ticket_id == Task.ticket_id, ticket_held))
+            .with_for_update(skip_locked=True)
         )
-        session.add(row)
-        return
+        statement = (
+            update(Task)
+            .where(Task.id.in_(held_ids.scalar_subquery()))
+            .values(
+                state=state,
+                updated_at=now,
+                next_run_at=None,
+                claimed_by=None,
+                claimed_at=None,
+                lease_expires_at=None,
+            )
+            .returning(Task.id, Task.state)
+            .execution_options(synchronize_session=False)
+        )
+        parked.extend(session.execute(statement).all())
+    return parked
 
-    row.state = state
-    row.current_task_id = current_task_id
-    row.last_seen_at = now_utc()
-    session.add(row)
+
+def cancel_requested_tasks(session: Session) -> list[Row]:
+    """Cancel every cancel-requested task that is not running, in one UPDATE.
+
+    Returns `(id, ticket_id)` rows for the tasks that were cancelled. Rows
+    another worker has locked are skipped and picked up by its own sweep.
+    """
+    now = now_utc()
+    pending_ids = (
+        select(Task.id)
+        .where(Task.cancel_requested.is_(True))
+        .where(Task.state.in_(["queued", "retrying", "paused", "blocked"]))
+        .with_for_update(skip_locked=True)
+    )
+    statement = (
+        update(Task)
+        .where(Task.id.in_(pending_ids.scalar_subquery()))
+        .values(
+            state="cancelled",
+            error_message="cancel requested",
+            completed_at=now,
+            updated_at=now,
+            claimed_by=None,
+            claimed_at=None,
+            lease_expires_at=None,
+            next_run_at=None,
+        )
+        .returning(Task.id, Task.ticket_id)
+        .execution_options(synchronize_session=False)
+    )
+    return list(session.execute(statement).all())
+
+
+def renew_task_leases(session: Session, *, leases: Mapping[int, str], lease_seconds: int) -> set[int]:
+    """Extend running tasks' leases in one UPDATE; returns the ids their worker still owns.
+
+    `leases` maps task id to the worker that claimed it. A paused ticket flags
+    its task for cancellation in the same statement so cooperative executors
+    stop at their next check.
+    """
+    if not leases:
+        return set()
+    now = now_utc()
+    ticket_paused = exists().where(Ticket.ticket_id == Task.ticket_id, Ticket.paused.is_(True))
+    statement = (
+        update(Task)
+        .where(Task.id.in_(list(leases)), Task.state == "running")
+        .where(Task.claimed_by == case(dict(leases), value=Task.id))
+        .values(
+            cancel_requested=case((ticket_paused, True), else_=Task.cancel_requested),
+            cancel_requested_at=case(
+                (and_(ticket_paused, Task.cancel_requested_at.is_(None)), now),
+                else_=Task.cancel_requested_at,
+            ),
+            lease_expires_at=now + timedelta(seconds=max(int(lease_seconds), 1)),
+            updated_at=now,
+        )
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    )
+    return set(session.scalars(statement).all())
+
+
+def get_task(session: Session, task_id: int) -> Optional[Task]:
+    return session.get(Task, task_id)
+
+
+def update_heartbeat(session: Session, worker_id: str, state: str, current_task_id: int | None) -> None:
+    # Single-statement upsert; both supported dialects accept ON CONFLICT DO UPDATE.
+    upsert = pg_insert if session.get_bind().dialect.name == "postgresql" else sqlite_insert
+    statement = upsert(WorkerHeartbeat).values(
+        worker_id=worker_id,
+        state=state,
+        current_task_id=current_task_id,
+        last_seen_at=now_utc(),
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[WorkerHeartbeat.worker_id],
+        set_={
+            "state": statement.excluded.state,
+            "current_task_id": statement.excluded.current_task_id,
+            "last_seen_at": statement.excluded.last_seen_at,
+        },
+    )
+    session.execute(statement)
 
 
 def add_task_log(
@@ -100,6 +399,66 @@ def add_task_log(
     return row
 
 
+def add_task_logs(session: Session, rows: list[dict[str, Any]]) -> None:
+    """Insert many task logs in one executemany; rows take add_task_log's keyword fields."""
+    if not rows:
+        return
+    created_at = now_utc()
+    session.execute(
+        insert(TaskLog),
+        [
+            {
+                "task_id": row["task_id"],
+                "message": row["message"],
+                "log_type": row.get("log_type", "info"),
+                "success": row.get("success"),
+                "details": row.get("details") or {},
+                "created_at": created_at,
+            }
+            for row in rows
+        ],
+    )
+
+
+def finalize_task_and_log(
+    session: Session,
+    task_id: int,
+    values: Mapping[str, Any],
+    log: Mapping[str, Any],
+) -> None:
+    """Write `values` to one task and add its log; `log` takes add_task_log's keyword fields.
+
+    On PostgreSQL both go out as a single `WITH ... UPDATE ... RETURNING`
+    feeding an `INSERT ... SELECT`, so the log only lands if the task row
+    exists. Other dialects run the UPDATE and INSERT back to back. Loaded
+    instances are not synchronized; callers update their copy themselves.
+    """
+    task_update = update(Task).where(Task.id == task_id).values(**values)
+    log_values = {
+        "message": log["message"],
+        "log_type": log.get("log_type", "info"),
+        "success": log.get("success"),
+        "details": log.get("details") or {},
+        "created_at": now_utc(),
+    }
+    if session.get_bind().dialect.name != "postgresql":
+        session.execute(task_update.execution_options(synchronize_session=False))
+        session.execute(insert(TaskLog).values(task_id=task_id, **log_values))
+        return
+
+    updated = task_update.returning(Task.id).cte("updated_task")
+    columns = TaskLog.__table__.c
+    session.execute(
+        insert(TaskLog).from_select(
+            ["task_id", *log_values],
+            select(
+                updated.c.id,
+                *(literal(value, columns[key].type) for key, value in log_values.items()),
+            ),
+        )
+    )
+
+
 def add_ticket_event(
     session: Session,
     *,
@@ -113,17 +472,37 @@ def add_ticket_event(
         payload=payload or {},
     )
     session.add(row)
+    notify_ticket_event(session, ticket_id=ticket_id, event_type=event_type)
     return row
 
 
-def list_ticket_events(session: Session, ticket_id: str, limit: int = 100) -> list[TicketEvent]:
+def list_ticket_events(
+    session: Session,
+    ticket_id: str,
+    limit: int = 100,
+    *,
+    cursor: tuple[datetime, int | None] | None = None,
+) -> list[TicketEvent]:
+    """Newest events first; pass the last row's `(created_at, id)` as `cursor` for the next page."""
+    statement = select(TicketEvent).where(TicketEvent.ticket_id == ticket_id)
+    if cursor is not None:
+        statement = statement.where(
+            _keyset_filter(TicketEvent.created_at, TicketEvent.id, cursor, descending=True)
+        )
+    statement = statement.order_by(TicketEvent.created_at.desc(), TicketEvent.id.desc()).limit(limit)
+    return list(session.exec(statement).all())
+
+
+def iter_ticket_events(session: Session, ticket_id: str, limit: int = 100) -> Iterator[TicketEvent]:
+    """Yield events newest-first, fetching rows in batches instead of all at once."""
     statement = (
         select(TicketEvent)
         .where(TicketEvent.ticket_id == ticket_id)
         .order_by(TicketEvent.created_at.desc())
         .limit(limit)
+        .execution_options(yield_per=100)
     )
-    return list(session.exec(statement).all())
+    yield from session.exec(statement)
 
 
 def get_unconsumed_ticket_event(
@@ -142,9 +521,37 @@ def get_unconsumed_ticket_event(
     return session.exec(statement).first()
 
 
+def consume_ticket_event(session: Session, *, event_id: int, task_id: int | None) -> Optional[Row]:
+    """Mark an event consumed in one conditional UPDATE.
+
+    Returns the consumed row's (id, event_type, payload, created_at), or None if
+    another worker consumed it first.
+    """
+    statement = (
+        update(TicketEvent)
+        .where(TicketEvent.id == event_id, TicketEvent.consumed_at.is_(None))
+        .values(consumed_at=now_utc(), consumed_by_task_id=task_id)
+        .returning(
+            TicketEvent.id,
+            TicketEvent.event_type,
+            TicketEvent.payload,
+            TicketEvent.created_at,
+        )
+    )
+    return session.execute(statement).one_or_none()
+
+
+def get_next_schedule_run_at(session: Session) -> Optional[datetime]:
+    statement = (
+        select(func.min(TicketSchedule.next_run_at))
+        .where(TicketSchedule.active.is_(True))
+        .where(TicketSchedule.next_run_at.is_not(None))
+    )
+    return session.exec(statement).one()
+
+
 def get_schedule_by_id(session: Session, schedule_id: int) -> Optional[TicketSchedule]:
-    statement = select(TicketSchedule).where(TicketSchedule.id == schedule_id)
-    return session.exec(statement).first()
+    return session.get(TicketSchedule, schedule_id)
 
 
 def get_schedule_by_key(session: Session, schedule_key: str) -> Optional[TicketSchedule]:
@@ -152,10 +559,17 @@ def get_schedule_by_key(session: Session, schedule_key: str) -> Optional[TicketS
     return session.exec(statement).first()
 
 
-def list_schedules(session: Session, limit: int = 200) -> list[TicketSchedule]:
-    statement = (
-        select(TicketSchedule)
-        .order_by(TicketSchedule.created_at.asc())
-        .limit(limit)
-    )
+def list_schedules(
+    session: Session,
+    limit: int = 200,
+    *,
+    cursor: tuple[datetime, int | None] | None = None,
+) -> list[TicketSchedule]:
+    """Oldest schedules first; pass the last row's `(created_at, id)` as `cursor` for the next page."""
+    statement = select(TicketSchedule)
+    if cursor is not None:
+        statement = statement.where(
+            _keyset_filter(TicketSchedule.created_at, TicketSchedule.id, cursor, descending=False)
+        )
+    statement = statement.order_by(TicketSchedule.created_at.asc(), TicketSchedule.id.asc()).limit(limit)
     return list(session.exec(statement).all())
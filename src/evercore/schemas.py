@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class TicketCreateRequest(BaseModel):
@@ -28,6 +28,8 @@ class TaskCreateRequest(BaseModel):
 
 
 class TaskSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     ticket_id: str
     task_key: str
@@ -53,6 +55,8 @@ class TaskSummary(BaseModel):
 
 
 class TicketSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     ticket_id: str
     title: Optional[str]
@@ -108,6 +112,8 @@ class TicketEventCreateRequest(BaseModel):
 
 
 class TicketEventSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     ticket_id: str
     event_type: str
@@ -133,6 +139,8 @@ class ScheduleCreateRequest(BaseModel):
 
 
 class ScheduleSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     schedule_key: str
     active: bool
@@ -151,7 +159,37 @@ class ScheduleSummary(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @field_validator("workflow_input", "context_data", "task_payload", mode="before")
+    @classmethod
+    def _null_json_as_empty(cls, value: Any) -> Any:
+        # Rows written before these columns had defaults can still hold NULL.
+        return {} if value is None else value
+
 
 class ScheduleTriggerResponse(BaseModel):
     schedule_id: int
     triggered_ticket_id: str
+
+
+class ScheduleRunDueResponse(BaseModel):
+    processed: int
+
+
+class AgentPromptRequest(BaseModel):
+    prompt: str = Field(..., min_length=1)
+    model: Optional[str] = None
+    system_prompt: Optional[str] = None
+    temperature: Optional[float] = None
+
+
+class AgentBatchRunRequest(BaseModel):
+    prompts: list[AgentPromptRequest] = Field(..., min_length=1, max_length=100)
+
+
+class AgentRunResult(BaseModel):
+    success: bool
+    text: str = ""
+    usage: Optional[dict[str, Any]] = None
+    provider: Optional[str] = None
+    model_used: Optional[str] = None
+    error: Optional[str] = None
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from sqlmodel import Session, select
 
+from evercore.event_bus import notify_schedules_changed
 from evercore.models import TicketSchedule
-from evercore.repositories import get_schedule_by_id, get_schedule_by_key, list_schedules
+from evercore.repositories import (
+    get_next_schedule_run_at,
+    get_schedule_by_id,
+    get_schedule_by_key,
+    list_schedules,
+)
 from evercore.schemas import ScheduleCreateRequest, TaskCreateRequest, TicketCreateRequest
 from evercore.settings import settings
 from evercore.time_utils import coerce_utc, now_utc
@@ -25,7 +31,8 @@ class SchedulerService:
         if payload.interval_seconds is None and payload.first_run_at is None:
             raise ValueError("either first_run_at or interval_seconds must be provided")
 
-        first_run_at = coerce_utc(payload.first_run_at) or now_utc()
+        now = now_utc()
+        first_run_at = coerce_utc(payload.first_run_at) or now
         schedule = TicketSchedule(
             schedule_key=payload.schedule_key.strip(),
             active=True,
@@ -34,21 +41,30 @@ class SchedulerService:
             ticket_title=payload.ticket_title,
             workflow_key=(payload.workflow_key or settings.default_workflow_key),
             workflow_version=payload.workflow_version,
-            workflow_input=dict(payload.workflow_input or {}),
-            context_data=dict(payload.context_data or {}),
+            workflow_input=payload.workflow_input or {},
+            context_data=payload.context_data or {},
             source_type=payload.source_type,
             task_key=payload.task_key,
-            task_payload=dict(payload.task_payload or {}),
+            task_payload=payload.task_payload or {},
             task_max_attempts=payload.task_max_attempts,
-            created_at=now_utc(),
-            updated_at=now_utc(),
+            created_at=now,
+            updated_at=now,
         )
         session.add(schedule)
         session.flush()
+        notify_schedules_changed(session)
         return schedule
 
-    def list_schedules(self, session: Session, limit: int = 200) -> list[TicketSchedule]:
-        return list_schedules(session, limit=limit)
+    def list_schedules(
+        self,
+        session: Session,
+        limit: int = 200,
+        *,
+        after: datetime | None = None,
+        after_id: int | None = None,
+    ) -> list[TicketSchedule]:
+        cursor = None if after is None else (after, after_id)
+        return list_schedules(session, limit=limit, cursor=cursor)
 
     def pause_schedule(self, session: Session, schedule_id: int) -> TicketSchedule:
         schedule = get_schedule_by_id(session, schedule_id)
@@ -63,11 +79,13 @@ class SchedulerService:
         schedule = get_schedule_by_id(session, schedule_id)
         if schedule is None:
             raise ValueError(f"schedule not found: {schedule_id}")
+        now = now_utc()
         schedule.active = True
         if schedule.next_run_at is None:
-            schedule.next_run_at = now_utc()
-        schedule.updated_at = now_utc()
+            schedule.next_run_at = now
+        schedule.updated_at = now
         session.add(schedule)
+        notify_schedules_changed(session)
         return schedule
 
     def trigger_schedule_once(self, session: Session, schedule_id: int) -> str:
@@ -86,16 +104,25 @@ class SchedulerService:
             .order_by(TicketSchedule.next_run_at.asc())
             .limit(max(1, limit))
             .with_for_update(skip_locked=True)
+            # Stream locked rows in small chunks rather than materializing the whole batch.
+            .execution_options(yield_per=16)
         )
-        due_rows = list(session.exec(statement).all())
-        if not due_rows:
-            return 0
+        processed = 0
+        for schedule in session.exec(statement):
+            self._run_schedule(session, schedule, flush=False)
+            processed += 1
+        # Pending tickets/tasks/schedule updates go out together, batched per table.
+        session.flush()
+        return processed
 
-        for schedule in due_rows:
-            self._run_schedule(session, schedule)
-        return len(due_rows)
+    def seconds_until_next_due(self, session: Session, *, max_seconds: float) -> float:
+        """How long a scheduler loop may idle before the earliest active schedule is due."""
+        next_run_at = coerce_utc(get_next_schedule_run_at(session))
+        if next_run_at is None:
+            return max_seconds
+        return min(max((next_run_at - now_utc()).total_seconds(), 0.0), max_seconds)
 
-    def _run_schedule(self, session: Session, schedule: TicketSchedule) -> str:
+    def _run_schedule(self, session: Session, schedule: TicketSchedule, *, flush: bool = True) -> str:
         now = now_utc()
         ticket = self.ticket_service.create_ticket(
             session,
@@ -104,19 +131,21 @@ class SchedulerService:
                 source_type=schedule.source_type,
                 workflow_key=schedule.workflow_key,
                 workflow_version=schedule.workflow_version,
-                workflow_input=dict(schedule.workflow_input or {}),
-                context_data=dict(schedule.context_data or {}),
+                workflow_input=schedule.workflow_input or {},
+                context_data=schedule.context_data or {},
             ),
+            flush=flush,
         )
         if schedule.task_key:
             self.ticket_service.create_task(
                 session,
-                ticket.ticket_id,
+                ticket,
                 TaskCreateRequest(
                     task_key=schedule.task_key,
-                    payload=dict(schedule.task_payload or {}),
+                    payload=schedule.task_payload or {},
                     max_attempts=schedule.task_max_attempts,
                 ),
+                flush=flush,
             )
 
         schedule.last_run_at = now
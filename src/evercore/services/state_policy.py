@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Protocol
+from typing import Final, Protocol
 
 from evercore.models import Task, Ticket
 from evercore.time_utils import now_utc
 
 
-@dataclass
+@dataclass(frozen=True)
 class TicketStateUpdate:
     """Resolved ticket lifecycle state after task processing."""
 
@@ -26,6 +27,13 @@ class TicketStatePolicy(Protocol):
         """Return the next ticket state from current ticket + tasks."""
 
 
+# Shared outcomes with no completed_at; TicketStateUpdate is frozen, so reuse is safe.
+_PENDING_APPROVAL: Final = TicketStateUpdate(stage="pending_approval", status="waiting_approval", completed_at=None)
+_NEEDS_ATTENTION: Final = TicketStateUpdate(stage="review", status="attention", completed_at=None)
+_QUEUED_ACTIVE: Final = TicketStateUpdate(stage="queued", status="active", completed_at=None)
+_RUNNING_ACTIVE: Final = TicketStateUpdate(stage="running", status="active", completed_at=None)
+
+
 class DefaultTicketStatePolicy:
     """Default task-driven policy for standalone evercore."""
 
@@ -33,24 +41,20 @@ class DefaultTicketStatePolicy:
         if bool(ticket.paused):
             return TicketStateUpdate(stage=ticket.stage, status="paused", completed_at=ticket.completed_at)
 
-        if bool(ticket.approval_required) and ticket.approval_status == "pending":
-            return TicketStateUpdate(stage="pending_approval", status="waiting_approval", completed_at=None)
-
-        if bool(ticket.approval_required) and ticket.approval_status == "rejected":
-            return TicketStateUpdate(stage="review", status="attention", completed_at=None)
+        if bool(ticket.approval_required):
+            if ticket.approval_status == "pending":
+                return _PENDING_APPROVAL
+            if ticket.approval_status == "rejected":
+                return _NEEDS_ATTENTION
 
         if not tasks:
-            return TicketStateUpdate(stage="queued", status="active", completed_at=None)
+            return _QUEUED_ACTIVE
 
-        any_failed = any(task.state in {"failed", "dead_letter"} for task in tasks)
-        any_running = any(task.state == "running" for task in tasks)
-        any_queued = any(task.state in {"queued", "retrying"} for task in tasks)
-        all_completed = all(task.state == "completed" for task in tasks)
+        # One pass over the tasks; branch on the tallies.
+        states = Counter(task.state for task in tasks)
 
-        if any_failed:
-            return TicketStateUpdate(stage="review", status="attention", completed_at=None)
-        if all_completed:
+        if states["failed"] + states["dead_letter"]:
+            return _NEEDS_ATTENTION
+        if states["completed"] == len(tasks):
             return TicketStateUpdate(stage="finished", status="completed", completed_at=now_utc())
-        if any_running or any_queued:
-            return TicketStateUpdate(stage="running", status="active", completed_at=None)
-        return TicketStateUpdate(stage="running", status="active", completed_at=None)
+        return _RUNNING_ACTIVE
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-import uuid
-from collections.abc import Iterable
+import functools
+import secrets
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime
 
 from sqlmodel import Session
 
@@ -15,6 +18,7 @@ from evercore.repositories import (
     list_ticket_events,
     list_tasks_for_ticket,
     list_tickets,
+    update_ticket_tasks,
 )
 from evercore.schemas import TaskCreateRequest, TaskSummary, TicketCreateRequest, TicketSummary
 from evercore.settings import settings
@@ -22,37 +26,73 @@ from evercore.time_utils import coerce_utc, now_utc
 from evercore.workflow import WorkflowLoader
 
 
+def _new_ticket_id() -> str:
+    # 48-bit millisecond timestamp then 32 random bits (UUIDv7-style), so new ids
+    # append to the right edge of the ticket_id index instead of landing randomly.
+    return f"tkt-{time.time_ns() // 1_000_000:012x}{secrets.token_hex(4)}"
+
+
+# Ticket attributes a `when` path may read; keeps ORM internals and methods out of reach.
+_TICKET_FIELDS: frozenset[str] = frozenset(Ticket.model_fields)
+
+# `when` path prefixes and the mapping each one resolves against (`ticket.` is routed separately).
+_LOOKUP_ROOTS: dict[str, Callable[[Ticket, dict | None], object]] = {
+    "context": lambda ticket, transition_context: transition_context or {},
+    "workflow_input": lambda ticket, transition_context: ticket.workflow_input or {},
+    "task_result": lambda ticket, transition_context: transition_context or {},
+}
+
+
 class TicketService:
     def __init__(self, workflow_loader: WorkflowLoader):
         self.workflow_loader = workflow_loader
 
-    def create_ticket(self, session: Session, payload: TicketCreateRequest) -> Ticket:
+    def create_ticket(
+        self,
+        session: Session,
+        payload: TicketCreateRequest,
+        *,
+        flush: bool = True,
+    ) -> Ticket:
         workflow_key = (payload.workflow_key or settings.default_workflow_key).strip()
         workflow = self.workflow_loader.load(workflow_key)
 
+        now = now_utc()
         ticket = Ticket(
-            ticket_id=f"tkt-{uuid.uuid4().hex[:10]}",
+            ticket_id=_new_ticket_id(),
             title=payload.title,
             source_type=payload.source_type,
             workflow_key=workflow.key,
             workflow_version=payload.workflow_version or workflow.version,
-            workflow_input=dict(payload.workflow_input or {}),
-            context_data=dict(payload.context_data or {}),
+            workflow_input=payload.workflow_input or {},
+            context_data=payload.context_data or {},
             stage=workflow.initial_stage,
             status="active",
             approval_required=False,
             approval_status="none",
-            created_at=now_utc(),
-            updated_at=now_utc(),
+            created_at=now,
+            updated_at=now,
         )
         session.add(ticket)
-        session.flush()
+        if flush:
+            session.flush()
         return ticket
 
-    def create_task(self, session: Session, ticket_id: str, payload: TaskCreateRequest) -> Task:
-        ticket = get_ticket_by_ticket_id(session, ticket_id)
-        if ticket is None:
-            raise ValueError(f"ticket not found: {ticket_id}")
+    def create_task(
+        self,
+        session: Session,
+        ticket_or_id: Ticket | str,
+        payload: TaskCreateRequest,
+        *,
+        flush: bool = True,
+    ) -> Task:
+        # Callers that just created the ticket pass it in and skip the lookup.
+        if isinstance(ticket_or_id, Ticket):
+            ticket = ticket_or_id
+        else:
+            ticket = get_ticket_by_ticket_id(session, ticket_or_id)
+            if ticket is None:
+                raise ValueError(f"ticket not found: {ticket_or_id}")
 
         initial_state = "queued"
         if bool(ticket.paused):
@@ -60,24 +100,27 @@ class TicketService:
         elif bool(ticket.approval_required) and ticket.approval_status == "pending":
             initial_state = "blocked"
 
+        now = now_utc()
         task = Task(
             ticket_id=ticket.ticket_id,
             task_key=payload.task_key,
             state=initial_state,
-            payload=dict(payload.payload or {}),
+            payload=payload.payload or {},
             result_data={},
             max_attempts=payload.max_attempts or settings.default_max_attempts,
             retry_base_seconds=payload.retry_base_seconds,
             retry_max_seconds=payload.retry_max_seconds,
             timeout_seconds=payload.timeout_seconds,
-            created_at=now_utc(),
-            updated_at=now_utc(),
+            created_at=now,
+            updated_at=now,
         )
         session.add(task)
-        session.flush()
 
         dependency_ids = [dep_id for dep_id in payload.depends_on_task_ids if dep_id > 0]
-        add_task_dependencies(session, task.id, dependency_ids)
+        if flush or dependency_ids:
+            # Dependency rows need task.id.
+            session.flush()
+            add_task_dependencies(session, task.id, dependency_ids)
 
         if initial_state == "blocked":
             ticket.stage = "pending_approval"
@@ -87,7 +130,7 @@ class TicketService:
         else:
             ticket.stage = "running"
             ticket.status = "active"
-        ticket.updated_at = now_utc()
+        ticket.updated_at = now
         session.add(ticket)
         return task
 
@@ -109,9 +152,7 @@ class TicketService:
             raise ValueError(f"current stage '{ticket.stage}' is not defined in workflow '{workflow.key}'")
 
         chosen_transition = None
-        for transition in stage_def.transitions:
-            if target_stage and transition.target != target_stage:
-                continue
+        for transition in stage_def.transitions_to(target_stage):
             if self._evaluate_when(transition.when, ticket, transition_context):
                 chosen_transition = transition
                 break
@@ -123,10 +164,11 @@ class TicketService:
                 )
             raise ValueError(f"no valid transition from stage '{ticket.stage}'")
 
+        now = now_utc()
         ticket.stage = chosen_transition.target
         if ticket.stage == "finished":
             ticket.status = "completed"
-            ticket.completed_at = ticket.completed_at or now_utc()
+            ticket.completed_at = ticket.completed_at or now
         elif ticket.stage == "pending_approval":
             ticket.approval_required = True
             if ticket.approval_status == "none":
@@ -136,7 +178,7 @@ class TicketService:
             ticket.status = "paused"
         else:
             ticket.status = "active"
-        ticket.updated_at = now_utc()
+        ticket.updated_at = now
         session.add(ticket)
         return ticket
 
@@ -162,13 +204,12 @@ class TicketService:
         ticket.updated_at = now
         session.add(ticket)
 
-        tasks = list_tasks_for_ticket(session, ticket.ticket_id)
-        for task in tasks:
-            if task.state in {"queued", "retrying"}:
-                task.state = "blocked"
-                task.next_run_at = None
-                task.updated_at = now
-                session.add(task)
+        update_ticket_tasks(
+            session,
+            ticket.ticket_id,
+            states=("queued", "retrying"),
+            values={"state": "blocked", "next_run_at": None, "updated_at": now},
+        )
         return ticket
 
     def approve_ticket(
@@ -193,14 +234,13 @@ class TicketService:
         ticket.updated_at = now
         session.add(ticket)
 
-        tasks = list_tasks_for_ticket(session, ticket.ticket_id)
         if not ticket.paused:
-            for task in tasks:
-                if task.state == "blocked":
-                    task.state = "queued"
-                    task.next_run_at = now
-                    task.updated_at = now
-                    session.add(task)
+            update_ticket_tasks(
+                session,
+                ticket.ticket_id,
+                states=("blocked",),
+                values={"state": "queued", "next_run_at": now, "updated_at": now},
+            )
         return ticket
 
     def reject_ticket(
@@ -237,18 +277,18 @@ class TicketService:
         ticket.updated_at = now
         session.add(ticket)
 
-        tasks = list_tasks_for_ticket(session, ticket.ticket_id)
-        for task in tasks:
-            if task.state in {"queued", "retrying", "blocked"}:
-                task.state = "paused"
-                task.next_run_at = None
-                task.updated_at = now
-                session.add(task)
-            elif task.state == "running":
-                task.cancel_requested = True
-                task.cancel_requested_at = now
-                task.updated_at = now
-                session.add(task)
+        update_ticket_tasks(
+            session,
+            ticket.ticket_id,
+            states=("queued", "retrying", "blocked"),
+            values={"state": "paused", "next_run_at": None, "updated_at": now},
+        )
+        update_ticket_tasks(
+            session,
+            ticket.ticket_id,
+            states=("running",),
+            values={"cancel_requested": True, "cancel_requested_at": now, "updated_at": now},
+        )
         return ticket
 
     def resume_ticket(self, session: Session, ticket_id: str) -> Ticket:
@@ -267,18 +307,11 @@ class TicketService:
         ticket.updated_at = now
         session.add(ticket)
 
-        tasks = list_tasks_for_ticket(session, ticket.ticket_id)
-        for task in tasks:
-            if task.state != "paused":
-                continue
-            if bool(ticket.approval_required) and ticket.approval_status == "pending":
-                task.state = "blocked"
-                task.next_run_at = None
-            else:
-                task.state = "queued"
-                task.next_run_at = now
-            task.updated_at = now
-            session.add(task)
+        if bool(ticket.approval_required) and ticket.approval_status == "pending":
+            resumed_values = {"state": "blocked", "next_run_at": None, "updated_at": now}
+        else:
+            resumed_values = {"state": "queued", "next_run_at": now, "updated_at": now}
+        update_ticket_tasks(session, ticket.ticket_id, states=("paused",), values=resumed_values)
         return ticket
 
     def publish_event(
@@ -301,31 +334,55 @@ class TicketService:
         session.flush()
         return row
 
-    def get_ticket_events(self, session: Session, ticket_id: str, limit: int = 100) -> list[TicketEvent]:
+    def get_ticket_events(
+        self,
+        session: Session,
+        ticket_id: str,
+        limit: int = 100,
+        *,
+        before: datetime | None = None,
+        before_id: int | None = None,
+    ) -> list[TicketEvent]:
         ticket = get_ticket_by_ticket_id(session, ticket_id)
         if ticket is None:
             raise ValueError(f"ticket not found: {ticket_id}")
-        return list_ticket_events(session, ticket_id=ticket_id, limit=limit)
+        cursor = None if before is None else (before, before_id)
+        return list_ticket_events(session, ticket_id=ticket_id, limit=limit, cursor=cursor)
 
     def get_ticket_summary(self, session: Session, ticket_id: str) -> TicketSummary | None:
         ticket = get_ticket_by_ticket_id(session, ticket_id)
         if ticket is None:
             return None
 
-        tasks = list_tasks_for_ticket(session, ticket.ticket_id)
-        return self._serialize_ticket(ticket, tasks)
+        return self.summarize_ticket(session, ticket)
 
-    def list_ticket_summaries(self, session: Session, limit: int = 100) -> list[TicketSummary]:
-        tickets = list_tickets(session, limit=limit)
-        results: list[TicketSummary] = []
-        for ticket in tickets:
+    def summarize_ticket(
+        self,
+        session: Session,
+        ticket: Ticket,
+        tasks: list[Task] | None = None,
+    ) -> TicketSummary:
+        """Serialize an already-loaded ticket, fetching its tasks unless given."""
+        if tasks is None:
             tasks = list_tasks_for_ticket(session, ticket.ticket_id)
-            results.append(self._serialize_ticket(ticket, tasks))
-        return results
+        return self._serialize_ticket(ticket, tasks)
+
+    def list_ticket_summaries(
+        self,
+        session: Session,
+        limit: int = 100,
+        *,
+        before: datetime | None = None,
+        before_id: int | None = None,
+    ) -> list[TicketSummary]:
+        cursor = None if before is None else (before, before_id)
+        tickets = list_tickets(session, limit=limit, cursor=cursor, eager=True)
+        return [self._serialize_ticket(ticket, ticket.tasks) for ticket in tickets]
 
     def _serialize_ticket(self, ticket: Ticket, tasks: list[Task]) -> TicketSummary:
+        # Rows are already typed by the ORM, so build summaries without a validation pass.
         serialized_tasks = [
-            TaskSummary(
+            TaskSummary.model_construct(
                 id=task.id,
                 ticket_id=task.ticket_id,
                 task_key=task.task_key,
@@ -352,7 +409,7 @@ class TicketService:
             for task in tasks
         ]
 
-        return TicketSummary(
+        return TicketSummary.model_construct(
             id=ticket.id,
             ticket_id=ticket.ticket_id,
             title=ticket.title,
@@ -383,21 +440,24 @@ class TicketService:
         ticket: Ticket,
         transition_context: dict | None,
     ) -> bool:
-        expression = (when or "").strip()
-        if not expression:
-            return True
-        if expression.lower() in {"true", "always"}:
-            return True
+        return self._compile_when((when or "").strip())(ticket, transition_context)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _compile_when(expression: str) -> Callable[[Ticket, dict | None], bool]:
+        """Parse a `when` expression once; workflow definitions are static."""
+        if not expression or expression.lower() in {"true", "always"}:
+            return lambda ticket, transition_context: True
         if expression.lower() in {"false", "never"}:
-            return False
+            return lambda ticket, transition_context: False
 
-        left, operator, right = self._split_comparison(expression)
+        left, operator, right = TicketService._split_comparison(expression)
         if operator:
-            left_value = self._lookup(left, ticket, transition_context)
-            right_value = self._coerce_literal(right)
+            lookup = TicketService._compile_lookup(left.strip())
+            right_value = TicketService._coerce_literal(right)
             if operator == "==":
-                return left_value == right_value
-            return left_value != right_value
+                return lambda ticket, transition_context: lookup(ticket, transition_context) == right_value
+            return lambda ticket, transition_context: lookup(ticket, transition_context) != right_value
 
         invert = False
         lookup_key = expression
@@ -408,8 +468,13 @@ class TicketService:
             invert = True
             lookup_key = expression[1:].strip()
 
-        resolved = bool(self._lookup(lookup_key, ticket, transition_context))
-        return not resolved if invert else resolved
+        lookup = TicketService._compile_lookup(lookup_key.strip())
+
+        def _evaluate(ticket: Ticket, transition_context: dict | None) -> bool:
+            resolved = bool(lookup(ticket, transition_context))
+            return not resolved if invert else resolved
+
+        return _evaluate
 
     @staticmethod
     def _split_comparison(expression: str) -> tuple[str, str | None, str]:
@@ -439,28 +504,47 @@ class TicketService:
 
     @staticmethod
     def _lookup(path: str, ticket: Ticket, transition_context: dict | None) -> object:
-        token = path.strip()
-        if token.startswith("ticket."):
-            return TicketService._dig(vars(ticket), token.split(".", 1)[1])
-        if token.startswith("context."):
-            return TicketService._dig(transition_context or {}, token.split(".", 1)[1])
-        if token.startswith("workflow_input."):
-            return TicketService._dig(ticket.workflow_input or {}, token.split(".", 1)[1])
-        if token.startswith("task_result."):
-            return TicketService._dig(transition_context or {}, token.split(".", 1)[1])
-
-        if transition_context and token in transition_context:
-            return transition_context[token]
-        if ticket.workflow_input and token in ticket.workflow_input:
-            return ticket.workflow_input[token]
-        if hasattr(ticket, token):
-            return getattr(ticket, token)
-        return None
+        return TicketService._compile_lookup(path.strip())(ticket, transition_context)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _compile_lookup(token: str) -> Callable[[Ticket, dict | None], object]:
+        """Route a lookup path once: one partition and one prefix-table probe."""
+        head, separator, rest = token.partition(".")
+        if separator and head == "ticket":
+            field, *nested = list(TicketService._path_parts(rest)) or [""]
+            if field not in _TICKET_FIELDS:
+                return lambda ticket, transition_context: None
+            nested_parts = tuple(nested)
+            return lambda ticket, transition_context: TicketService._dig_parts(
+                getattr(ticket, field), nested_parts
+            )
+        root = _LOOKUP_ROOTS.get(head) if separator else None
+        if root is not None:
+            parts = tuple(TicketService._path_parts(rest))
+            return lambda ticket, transition_context: TicketService._dig_parts(
+                root(ticket, transition_context), parts
+            )
+
+        def _lookup_bare(ticket: Ticket, transition_context: dict | None) -> object:
+            if transition_context and token in transition_context:
+                return transition_context[token]
+            if ticket.workflow_input and token in ticket.workflow_input:
+                return ticket.workflow_input[token]
+            if token in _TICKET_FIELDS:
+                return getattr(ticket, token)
+            return None
+
+        return _lookup_bare
 
     @staticmethod
     def _dig(root: object, dotted_path: str) -> object:
+        return TicketService._dig_parts(root, tuple(TicketService._path_parts(dotted_path)))
+
+    @staticmethod
+    def _dig_parts(root: object, parts: tuple[str, ...]) -> object:
         current = root
-        for key in TicketService._path_parts(dotted_path):
+        for key in parts:
             if isinstance(current, dict):
                 current = current.get(key)
             else:
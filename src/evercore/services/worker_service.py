@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
-from contextlib import suppress
-from typing import Callable
+import time
+from datetime import datetime
+from typing import Any, Callable
 
-from sqlalchemy import or_
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import defer
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import Session, select
 
 from evercore.execution import ExecutionResult, TaskExecutor
@@ -15,9 +19,15 @@ from evercore.executors import ExecutorRegistry
 from evercore.models import Task, Ticket
 from evercore.repositories import (
     add_task_log,
-    get_task,
+    add_task_logs,
+    cancel_requested_tasks,
+    claim_tasks,
+    finalize_task_and_log,
     get_ticket_by_ticket_id,
-    list_dependencies,
+    list_tasks_for_tickets,
+    list_tickets_by_ticket_ids,
+    park_held_ticket_tasks,
+    renew_task_leases,
     update_heartbeat,
 )
 from evercore.schemas import WorkerRunResponse
@@ -27,8 +37,7 @@ from evercore.task_control import TaskControl
 from evercore.task_runtime import (
     compute_next_retry_at,
     compute_retry_delay_seconds,
-    is_stale_running_task,
-    lease_expires_at,
+    compute_stale_cutoff,
     normalize_max_attempts,
     should_dead_letter,
 )
@@ -37,6 +46,62 @@ from evercore.time_utils import coerce_utc, now_utc
 logger = logging.getLogger(__name__)
 
 
+class _LeaseRenewer:
+    """One daemon thread renewing the leases of every task a WorkerService is executing.
+
+    Registration is a dict write, and each tick renews all registered leases with one
+    UPDATE per engine. The thread exits when nothing is registered and is restarted
+    by the next registration.
+    """
+
+    def __init__(self, *, lease_seconds: int, interval: float):
+        self._lease_seconds = lease_seconds
+        self._interval = interval
+        self._leases: dict[int, tuple[Any, str]] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def register(self, bind, task_id: int, worker_id: str) -> None:
+        with self._lock:
+            self._leases[task_id] = (bind, worker_id)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="evercore-lease-renewer", daemon=True)
+                self._thread.start()
+
+    def unregister(self, task_id: int) -> None:
+        with self._lock:
+            self._leases.pop(task_id, None)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._interval)
+            with self._lock:
+                if not self._leases:
+                    self._thread = None
+                    return
+                snapshot = dict(self._leases)
+            leases_by_bind: dict[Any, dict[int, str]] = {}
+            for task_id, (bind, worker_id) in snapshot.items():
+                leases_by_bind.setdefault(bind, {})[task_id] = worker_id
+            for bind, leases in leases_by_bind.items():
+                try:
+                    self._renew(bind, leases)
+                except Exception:  # noqa: BLE001
+                    logger.exception("lease renewal failed for %d task(s)", len(leases))
+
+    def _renew(self, bind, leases: dict[int, str]) -> None:
+        with Session(bind=bind, expire_on_commit=False) as lease_session:
+            renewed = renew_task_leases(lease_session, leases=leases, lease_seconds=self._lease_seconds)
+            with self._lock:
+                # Lost leases stop renewing; finished tasks must not flip back to "working".
+                for task_id in leases.keys() - renewed:
+                    self._leases.pop(task_id, None)
+                live = [task_id for task_id in renewed if task_id in self._leases]
+            for task_id in live:
+                update_heartbeat(lease_session, leases[task_id], "working", task_id)
+            lease_session.commit()
+
+
 class WorkerService:
     def __init__(
         self,
@@ -49,14 +114,25 @@ class WorkerService:
         self.executor_registry = executor_registry
         self.ticket_state_policy = ticket_state_policy or DefaultTicketStatePolicy()
         self.timeout_recovery_handler = timeout_recovery_handler
+        # Clamped lease/staleness settings, resolved once instead of per task.
+        self._lease_seconds = max(int(settings.task_lease_seconds), 10)
+        self._renew_interval = max(2, self._lease_seconds // 3)
+        self._stale_timeout_seconds = max(int(settings.stale_task_timeout_seconds), 30)
+        self._reap_interval = min(self._lease_seconds, self._stale_timeout_seconds) / 4
+        self._lease_renewer = _LeaseRenewer(lease_seconds=self._lease_seconds, interval=self._renew_interval)
+        # Monotonic deadlines for the periodic sweeps that used to run on every poll.
+        self._next_reap_at = 0.0
+        self._next_cancel_sweep_at = 0.0
+        self._next_park_sweep_at = 0.0
 
     def process_once(self, session: Session, worker_id: str | None = None) -> WorkerRunResponse:
-        effective_worker_id = worker_id or settings.worker_id
+        effective_worker_id = worker_id or settings.resolved_worker_id
         bind = session.get_bind()
-        self._reap_stale_running_tasks(bind)
+        self._maybe_reap_stale_running_tasks(bind)
 
         with Session(bind=bind, expire_on_commit=False) as claim_session:
-            cancelled_before_claim = self._finalize_requested_cancellations(claim_session)
+            cancelled_before_claim = self._maybe_finalize_requested_cancellations(claim_session)
+            self._maybe_park_held_ticket_tasks(claim_session)
             task = self._claim_next_task(claim_session, effective_worker_id)
             if task is None:
                 update_heartbeat(claim_session, effective_worker_id, "idle", None)
@@ -85,27 +161,20 @@ class WorkerService:
                 success=None,
             )
             update_heartbeat(claim_session, effective_worker_id, "working", task_id)
-            claim_session.commit()
 
-        with Session(bind=bind, expire_on_commit=False) as load_session:
-            task_for_exec = load_session.exec(
-                select(Task).where(Task.id == task_id)
-            ).first()
-            ticket = get_ticket_by_ticket_id(load_session, ticket_id)
-            if task_for_exec is None:
-                update_heartbeat(load_session, effective_worker_id, "idle", None)
-                load_session.commit()
-                return WorkerRunResponse(
-                    processed=False, task_id=task_id, message="claimed task missing"
-                )
+            # Pre-execution checks share the claim transaction: one commit hands the
+            # task to the executor, and a failure here rolls the claim back as well.
+            # The claim's UPDATE ... RETURNING already carried the full task row.
+            task_for_exec = task
+            ticket = get_ticket_by_ticket_id(claim_session, ticket_id)
             if ticket is None:
                 self._mark_task_terminal_failure(
-                    load_session,
+                    claim_session,
                     task_for_exec,
                     f"missing ticket: {ticket_id}",
                 )
-                update_heartbeat(load_session, effective_worker_id, "idle", None)
-                load_session.commit()
+                update_heartbeat(claim_session, effective_worker_id, "idle", None)
+                claim_session.commit()
                 return WorkerRunResponse(
                     processed=True,
                     task_id=task_id,
@@ -113,10 +182,10 @@ class WorkerService:
                 )
 
             if bool(ticket.paused):
-                self._park_task_for_pause(load_session, task_for_exec)
-                self._sync_ticket_state(load_session, ticket)
-                update_heartbeat(load_session, effective_worker_id, "idle", None)
-                load_session.commit()
+                self._park_task_for_pause(claim_session, task_for_exec)
+                self._sync_ticket_state(claim_session, ticket)
+                update_heartbeat(claim_session, effective_worker_id, "idle", None)
+                claim_session.commit()
                 return WorkerRunResponse(
                     processed=True,
                     task_id=task_id,
@@ -124,10 +193,10 @@ class WorkerService:
                 )
 
             if bool(ticket.approval_required) and ticket.approval_status == "pending":
-                self._park_task_for_approval(load_session, task_for_exec)
-                self._sync_ticket_state(load_session, ticket)
-                update_heartbeat(load_session, effective_worker_id, "idle", None)
-                load_session.commit()
+                self._park_task_for_approval(claim_session, task_for_exec)
+                self._sync_ticket_state(claim_session, ticket)
+                update_heartbeat(claim_session, effective_worker_id, "idle", None)
+                claim_session.commit()
                 return WorkerRunResponse(
                     processed=True,
                     task_id=task_id,
@@ -135,10 +204,10 @@ class WorkerService:
                 )
 
             if bool(task_for_exec.cancel_requested):
-                self._mark_task_cancelled(load_session, task_for_exec)
-                self._sync_ticket_state(load_session, ticket)
-                update_heartbeat(load_session, effective_worker_id, "idle", None)
-                load_session.commit()
+                self._mark_task_cancelled(claim_session, task_for_exec)
+                self._sync_ticket_state(claim_session, ticket)
+                update_heartbeat(claim_session, effective_worker_id, "idle", None)
+                claim_session.commit()
                 return WorkerRunResponse(
                     processed=True,
                     task_id=task_id,
@@ -148,29 +217,23 @@ class WorkerService:
             executor = self.executor_registry.get(task_key)
             if executor is None:
                 self._mark_task_terminal_failure(
-                    load_session,
+                    claim_session,
                     task_for_exec,
                     f"unknown task_key: {task_key}",
                 )
-                self._sync_ticket_state(load_session, ticket)
-                update_heartbeat(load_session, effective_worker_id, "idle", None)
-                load_session.commit()
+                self._sync_ticket_state(claim_session, ticket)
+                update_heartbeat(claim_session, effective_worker_id, "idle", None)
+                claim_session.commit()
                 return WorkerRunResponse(
                     processed=True,
                     task_id=task_id,
                     message=f"unknown task_key: {task_key}",
                 )
 
-            # End read transaction before potentially long-running execution.
-            load_session.commit()
+            # End the claim transaction before potentially long-running execution.
+            claim_session.commit()
 
-        stop_lease_event = threading.Event()
-        lease_thread = threading.Thread(
-            target=self._lease_renewer_loop,
-            args=(bind, task_id, effective_worker_id, stop_lease_event),
-            daemon=True,
-        )
-        lease_thread.start()
+        self._lease_renewer.register(bind, task_id, effective_worker_id)
         result = None
         raised_exc: Exception | None = None
         try:
@@ -190,12 +253,16 @@ class WorkerService:
         except Exception as exc:  # noqa: BLE001
             raised_exc = exc
         finally:
-            stop_lease_event.set()
-            with suppress(Exception):
-                lease_thread.join(timeout=2.0)
+            self._lease_renewer.unregister(task_id)
 
         with Session(bind=bind, expire_on_commit=False) as finalize_session:
-            live_task = finalize_session.exec(select(Task).where(Task.id == task_id)).first()
+            # Re-read the row for external changes (cancel requests, reaper), but leave
+            # the JSON columns unloaded: finalization only ever overwrites result_data.
+            live_task = finalize_session.exec(
+                select(Task)
+                .where(Task.id == task_id)
+                .options(defer(Task.payload), defer(Task.result_data))
+            ).first()
             if live_task is None:
                 update_heartbeat(finalize_session, effective_worker_id, "idle", None)
                 finalize_session.commit()
@@ -238,18 +305,17 @@ class WorkerService:
                     details=dict(result.output or {}),
                 )
             elif result is not None and bool(result.success):
-                live_task.state = "completed"
-                live_task.result_data = dict(result.output or {})
-                live_task.error_message = None
-                live_task.completed_at = now_utc()
-                live_task.updated_at = now_utc()
-                live_task.claimed_by = None
-                live_task.claimed_at = None
-                live_task.lease_expires_at = None
-                live_task.next_run_at = None
-                add_task_log(
+                now = now_utc()
+                self._transition(
                     finalize_session,
-                    task_id=live_task.id,
+                    live_task,
+                    {
+                        "state": "completed",
+                        "result_data": dict(result.output or {}),
+                        "error_message": None,
+                        "completed_at": now,
+                        **self._released(now),
+                    },
                     log_type="info",
                     message=result.message or "task completed",
                     details=result.output or {},
@@ -286,68 +352,66 @@ class WorkerService:
             finalize_session.commit()
             return response
 
+    async def process_batch_async(
+        self,
+        session: Session,
+        worker_id: str | None = None,
+        max_tasks: int | None = None,
+    ) -> list[WorkerRunResponse]:
+        """Process up to `max_tasks` tasks, overlapping their executor calls.
+
+        Each slot runs `process_once` on its own thread under a slot-suffixed worker
+        id, so leases and heartbeats stay per slot. SQLite ignores SKIP LOCKED, so
+        there the slots run one after another to avoid double claims.
+        """
+        effective_worker_id = worker_id or settings.resolved_worker_id
+        slots = max(int(max_tasks or settings.worker_concurrency), 1)
+        if slots == 1 or session.get_bind().dialect.name == "sqlite":
+            responses: list[WorkerRunResponse] = []
+            for _ in range(slots):
+                response = await asyncio.to_thread(self.process_once, session, effective_worker_id)
+                responses.append(response)
+                if not response.processed:
+                    break
+            return responses
+
+        return list(
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(self.process_once, session, f"{effective_worker_id}:{slot}")
+                    for slot in range(slots)
+                )
+            )
+        )
+
     def _claim_next_task(self, session: Session, worker_id: str) -> Task | None:
-        now = now_utc()
-        statement = (
-            select(Task)
-            .where(Task.state.in_(["queued", "retrying"]))
-            .where(or_(Task.next_run_at.is_(None), Task.next_run_at <= now))
-            .where(or_(Task.cancel_requested.is_(None), Task.cancel_requested.is_(False)))
-            .order_by(Task.created_at.asc())
-            .with_for_update(skip_locked=True)
+        claimed = claim_tasks(
+            session,
+            worker_id,
+            batch_size=1,
+            lease_seconds=self._lease_seconds,
+            default_max_attempts=settings.default_max_attempts,
         )
-        candidates = list(session.exec(statement).all())
-        for candidate in candidates:
-            ticket = get_ticket_by_ticket_id(session, candidate.ticket_id)
-            if ticket is None:
-                self._mark_task_terminal_failure(
-                    session,
-                    candidate,
-                    f"missing ticket: {candidate.ticket_id}",
-                )
-                continue
-            if bool(ticket.paused):
-                self._park_task_for_pause(session, candidate)
-                continue
-            if bool(ticket.approval_required) and ticket.approval_status == "pending":
-                self._park_task_for_approval(session, candidate)
-                continue
-            if self._dependencies_satisfied(session, candidate.id):
-                candidate.max_attempts = normalize_max_attempts(
-                    candidate.max_attempts,
-                    settings.default_max_attempts,
-                )
-                candidate.state = "running"
-                candidate.attempt_count = int(candidate.attempt_count or 0) + 1
-                candidate.started_at = now
-                candidate.updated_at = now
-                candidate.next_run_at = None
-                candidate.claimed_by = worker_id
-                candidate.claimed_at = now
-                candidate.lease_expires_at = lease_expires_at(
-                    now,
-                    max(settings.task_lease_seconds, 10),
-                )
-                session.add(candidate)
-                return candidate
-        return None
-
-    def _dependencies_satisfied(self, session: Session, task_id: int) -> bool:
-        deps = list_dependencies(session, task_id)
-        if not deps:
-            return True
-
-        for dep in deps:
-            dep_task = get_task(session, dep.depends_on_task_id)
-            if dep_task is None or dep_task.state != "completed":
-                return False
-        return True
-
-    def _sync_ticket_state(self, session: Session, ticket: Ticket) -> None:
-        statement = select(Task).where(Task.ticket_id == ticket.ticket_id)
-        tasks = list(session.exec(statement).all())
-
-        ticket.updated_at = now_utc()
+        return claimed[0] if claimed else None
+
+    def _sync_ticket_state(
+        self,
+        session: Session,
+        ticket: Ticket,
+        tasks: list[Task] | None = None,
+        *,
+        now: datetime | None = None,
+    ) -> None:
+        if tasks is None:
+            # Policies resolve from task state; the JSON columns still load on access.
+            statement = (
+                select(Task)
+                .where(Task.ticket_id == ticket.ticket_id)
+                .options(defer(Task.payload), defer(Task.result_data))
+            )
+            tasks = session.exec(statement).all()
+
+        ticket.updated_at = now or now_utc()
         resolved = self.ticket_state_policy.resolve(ticket, tasks)
         ticket.stage = resolved.stage
         ticket.status = resolved.status
@@ -355,41 +419,42 @@ class WorkerService:
 
         session.add(ticket)
 
-    def _mark_task_terminal_failure(self, session: Session, task: Task, message: str) -> None:
-        task.state = "failed"
-        task.error_message = message
-        task.completed_at = now_utc()
-        task.updated_at = now_utc()
-        task.claimed_by = None
-        task.claimed_at = None
-        task.lease_expires_at = None
-        task.next_run_at = None
-        add_task_log(
+    def _mark_task_terminal_failure(
+        self, session: Session, task: Task, message: str, *, now: datetime | None = None
+    ) -> None:
+        now = now or now_utc()
+        self._transition(
             session,
-            task_id=task.id,
+            task,
+            {"state": "failed", "error_message": message, "completed_at": now, **self._released(now)},
             log_type="error",
             message=message,
             success=False,
         )
-        session.add(task)
 
-    def _mark_task_cancelled(self, session: Session, task: Task) -> None:
-        task.state = "cancelled"
-        task.error_message = "cancel requested"
-        task.completed_at = now_utc()
-        task.updated_at = now_utc()
-        task.claimed_by = None
-        task.claimed_at = None
-        task.lease_expires_at = None
-        task.next_run_at = None
-        add_task_log(
+    def _mark_task_cancelled(
+        self,
+        session: Session,
+        task: Task,
+        *,
+        now: datetime | None = None,
+        log_rows: list[dict] | None = None,
+    ) -> None:
+        now = now or now_utc()
+        self._transition(
             session,
-            task_id=task.id,
+            task,
+            {
+                "state": "cancelled",
+                "error_message": "cancel requested",
+                "completed_at": now,
+                **self._released(now),
+            },
+            log_rows=log_rows,
             log_type="warning",
             message="task cancelled after cancel request",
             success=False,
         )
-        session.add(task)
 
     def _finalize_retry_or_dead_letter(
         self,
@@ -398,34 +463,34 @@ class WorkerService:
         *,
         message: str,
         details: dict | None = None,
+        now: datetime | None = None,
+        log_rows: list[dict] | None = None,
     ) -> WorkerRunResponse:
-        now = now_utc()
-        attempt_count = int(task.attempt_count or 0)
+        now = now or now_utc()
+        attempt_count = task.attempt_count or 0
         max_attempts = normalize_max_attempts(
             task.max_attempts,
             settings.default_max_attempts,
         )
-        task.max_attempts = max_attempts
         retry_base_seconds, retry_max_seconds = self._retry_policy(task)
 
         if should_dead_letter(attempt_count, max_attempts):
-            task.state = "dead_letter"
-            task.error_message = message
-            task.completed_at = now
-            task.updated_at = now
-            task.claimed_by = None
-            task.claimed_at = None
-            task.lease_expires_at = None
-            task.next_run_at = None
-            add_task_log(
+            self._transition(
                 session,
-                task_id=task.id,
+                task,
+                {
+                    "state": "dead_letter",
+                    "max_attempts": max_attempts,
+                    "error_message": message,
+                    "completed_at": now,
+                    **self._released(now),
+                },
+                log_rows=log_rows,
                 log_type="error",
                 message=f"dead-lettered after {attempt_count} attempts: {message}",
                 details=details or {},
                 success=False,
             )
-            session.add(task)
             return WorkerRunResponse(
                 processed=True,
                 task_id=task.id,
@@ -437,34 +502,70 @@ class WorkerService:
             retry_base_seconds=retry_base_seconds,
             retry_max_seconds=retry_max_seconds,
         )
-        task.state = "retrying"
-        task.error_message = message
-        task.completed_at = None
-        task.updated_at = now
-        task.claimed_by = None
-        task.claimed_at = None
-        task.lease_expires_at = None
-        task.next_run_at = compute_next_retry_at(
-            now=now,
-            attempt_count=attempt_count,
-            retry_base_seconds=retry_base_seconds,
-            retry_max_seconds=retry_max_seconds,
-        )
-        add_task_log(
+        self._transition(
             session,
-            task_id=task.id,
+            task,
+            {
+                "state": "retrying",
+                "max_attempts": max_attempts,
+                "error_message": message,
+                "completed_at": None,
+                **self._released(now),
+                "next_run_at": compute_next_retry_at(
+                    now=now,
+                    attempt_count=attempt_count,
+                    retry_base_seconds=retry_base_seconds,
+                    retry_max_seconds=retry_max_seconds,
+                ),
+            },
+            log_rows=log_rows,
             log_type="warning",
             message=f"task failed, retrying in {retry_delay}s: {message}",
             details=details or {},
             success=False,
         )
-        session.add(task)
         return WorkerRunResponse(
             processed=True,
             task_id=task.id,
             message=f"retry scheduled in {retry_delay}s",
         )
 
+    @staticmethod
+    def _released(now: datetime) -> dict[str, Any]:
+        """Column values that hand a task back from its worker."""
+        return {
+            "updated_at": now,
+            "claimed_by": None,
+            "claimed_at": None,
+            "lease_expires_at": None,
+            "next_run_at": None,
+        }
+
+    @staticmethod
+    def _transition(
+        session: Session,
+        task: Task,
+        values: dict[str, Any],
+        *,
+        log_rows: list[dict] | None = None,
+        **log,
+    ) -> None:
+        """Write `values` to the task and log the change.
+
+        With `log_rows`, the task is updated through the unit of work and the log is
+        queued for the caller's bulk insert. Otherwise row and log go out together via
+        finalize_task_and_log, and the loaded task takes the values as already committed
+        so the flush does not write them again.
+        """
+        if log_rows is not None:
+            for key, value in values.items():
+                setattr(task, key, value)
+            log_rows.append({"task_id": task.id, **log})
+            return
+        finalize_task_and_log(session, task.id, values, log)
+        for key, value in values.items():
+            set_committed_value(task, key, value)
+
     def _finalize_deferred_task(
         self,
         session: Session,
@@ -476,29 +577,27 @@ class WorkerService:
     ) -> WorkerRunResponse:
         now = now_utc()
         retry_delay = max(int(defer_seconds or settings.event_wait_poll_interval_seconds), 1)
-        task.state = "retrying"
-        task.error_message = message
-        task.completed_at = None
-        task.updated_at = now
-        task.attempt_count = max(int(task.attempt_count or 1) - 1, 0)
-        task.claimed_by = None
-        task.claimed_at = None
-        task.lease_expires_at = None
-        task.next_run_at = compute_next_retry_at(
-            now=now,
-            attempt_count=1,
-            retry_base_seconds=retry_delay,
-            retry_max_seconds=retry_delay,
-        )
-        add_task_log(
+        self._transition(
             session,
-            task_id=task.id,
+            task,
+            {
+                "state": "retrying",
+                "error_message": message,
+                "completed_at": None,
+                "attempt_count": max((task.attempt_count or 1) - 1, 0),
+                **self._released(now),
+                "next_run_at": compute_next_retry_at(
+                    now=now,
+                    attempt_count=1,
+                    retry_base_seconds=retry_delay,
+                    retry_max_seconds=retry_delay,
+                ),
+            },
             log_type="info",
             message=f"task deferred for {retry_delay}s: {message}",
             details=details or {},
             success=None,
         )
-        session.add(task)
         return WorkerRunResponse(
             processed=True,
             task_id=task.id,
@@ -512,7 +611,6 @@ class WorkerService:
         task.claimed_by = None
         task.claimed_at = None
         task.lease_expires_at = None
-        session.add(task)
 
     def _park_task_for_approval(self, session: Session, task: Task) -> None:
         task.state = "blocked"
@@ -521,7 +619,6 @@ class WorkerService:
         task.claimed_by = None
         task.claimed_at = None
         task.lease_expires_at = None
-        session.add(task)
 
     @staticmethod
     def _retry_policy(task: Task) -> tuple[int, int]:
@@ -556,87 +653,113 @@ class WorkerService:
             return None
         return parsed
 
-    def _lease_renewer_loop(
-        self,
-        bind,
-        task_id: int,
-        worker_id: str,
-        stop_event: threading.Event,
-    ) -> None:
-        lease_seconds = max(int(settings.task_lease_seconds), 10)
-        renew_interval = max(2, lease_seconds // 3)
-        while not stop_event.wait(renew_interval):
-            with Session(bind=bind, expire_on_commit=False) as lease_session:
-                task = lease_session.exec(select(Task).where(Task.id == task_id)).first()
-                if task is None:
-                    lease_session.rollback()
-                    return
-                if task.state != "running" or task.claimed_by != worker_id:
-                    lease_session.rollback()
-                    return
-                ticket = get_ticket_by_ticket_id(lease_session, task.ticket_id)
-                if ticket is not None and bool(ticket.paused):
-                    task.cancel_requested = True
-                    task.cancel_requested_at = task.cancel_requested_at or now_utc()
-                now = now_utc()
-                task.lease_expires_at = lease_expires_at(now, lease_seconds)
-                task.updated_at = now
-                lease_session.add(task)
-                update_heartbeat(lease_session, worker_id, "working", task_id)
-                lease_session.commit()
+    def _maybe_reap_stale_running_tasks(self, bind) -> None:
+        # A lease cannot go stale faster than its length, so sweeping a few times per
+        # lease bounds recovery delay without a locking scan on every idle poll.
+        now = time.monotonic()
+        if now < self._next_reap_at:
+            return
+        self._next_reap_at = now + self._reap_interval
+        self._reap_stale_running_tasks(bind)
 
     def _reap_stale_running_tasks(self, bind) -> None:
         now = now_utc()
         with Session(bind=bind, expire_on_commit=False) as session:
-            stale_statement = select(Task).where(Task.state == "running").with_for_update(
-                skip_locked=True
+            # Only stale rows come back, so healthy running tasks are neither locked
+            # nor shipped; a live lease wins over started_at, as in is_stale_running_task.
+            stale_statement = (
+                select(Task)
+                .where(Task.state == "running")
+                .where(
+                    or_(
+                        Task.lease_expires_at <= now,
+                        and_(
+                            Task.lease_expires_at.is_(None),
+                            Task.started_at <= compute_stale_cutoff(now, self._stale_timeout_seconds),
+                        ),
+                    )
+                )
+                .with_for_update(skip_locked=True)
             )
-            stale_tasks = list(session.exec(stale_statement).all())
+            stale_tasks = session.exec(stale_statement).all()
             if not stale_tasks:
                 session.rollback()
                 return
 
+            log_rows: list[dict] = []
             for task in stale_tasks:
-                if not is_stale_running_task(
-                    now,
-                    lease_expires_at_value=task.lease_expires_at,
-                    started_at=task.started_at,
-                    stale_task_timeout_seconds=max(
-                        settings.stale_task_timeout_seconds,
-                        30,
-                    ),
-                ):
-                    continue
                 if bool(task.cancel_requested):
-                    self._mark_task_cancelled(session, task)
+                    self._mark_task_cancelled(session, task, now=now, log_rows=log_rows)
                     continue
                 # Treat lease expiry as a failed run and route through retry policy.
-                task.attempt_count = int(task.attempt_count or 0) + 1
+                task.attempt_count = (task.attempt_count or 0) + 1
                 self._finalize_retry_or_dead_letter(
                     session,
                     task,
                     message="task lease expired while running",
+                    now=now,
+                    log_rows=log_rows,
                 )
+            add_task_logs(session, log_rows)
             session.commit()
 
-    def _finalize_requested_cancellations(self, session: Session) -> int:
-        pending_statement = (
-            select(Task)
-            .where(Task.cancel_requested.is_(True))
-            .where(Task.state.in_(["queued", "retrying", "paused", "blocked"]))
-            .with_for_update(skip_locked=True)
+    def _maybe_finalize_requested_cancellations(self, session: Session) -> int:
+        # Claims already skip cancel-requested tasks, so finalizing them can wait for
+        # the next sweep; only the row state and ticket status lag behind.
+        now = time.monotonic()
+        if now < self._next_cancel_sweep_at:
+            return 0
+        self._next_cancel_sweep_at = now + settings.cancel_sweep_interval_seconds
+        return self._finalize_requested_cancellations(session)
+
+    def _maybe_park_held_ticket_tasks(self, session: Session) -> int:
+        # Claims skip tasks of paused or approval-pending tickets in SQL; parking
+        # them only corrects their state, so it runs on the cancellation cadence.
+        now = time.monotonic()
+        if now < self._next_park_sweep_at:
+            return 0
+        self._next_park_sweep_at = now + settings.cancel_sweep_interval_seconds
+        rows = park_held_ticket_tasks(session)
+        add_task_logs(
+            session,
+            [
+                {
+                    "task_id": row.id,
+                    "log_type": "info",
+                    "message": (
+                        "task parked: ticket paused"
+                        if row.state == "paused"
+                        else "task parked: ticket awaiting approval"
+                    ),
+                    "success": None,
+                }
+                for row in rows
+            ],
         )
-        rows = list(session.exec(pending_statement).all())
+        return len(rows)
+
+    def _finalize_requested_cancellations(self, session: Session) -> int:
+        # One UPDATE for the task rows and one INSERT for their logs, however many there are.
+        rows = cancel_requested_tasks(session)
         if not rows:
             return 0
+        add_task_logs(
+            session,
+            [
+                {
+                    "task_id": row.id,
+                    "log_type": "warning",
+                    "message": "task cancelled after cancel request",
+                    "success": False,
+                }
+                for row in rows
+            ],
+        )
 
-        affected_ticket_ids: set[str] = set()
-        for task in rows:
-            affected_ticket_ids.add(task.ticket_id)
-            self._mark_task_cancelled(session, task)
-
-        for ticket_id in affected_ticket_ids:
-            ticket = get_ticket_by_ticket_id(session, ticket_id)
-            if ticket is not None:
-                self._sync_ticket_state(session, ticket)
+        # Two IN queries for all affected tickets instead of two SELECTs per ticket.
+        affected_ticket_ids = {row.ticket_id for row in rows}
+        tasks_by_ticket = list_tasks_for_tickets(session, list(affected_ticket_ids))
+        now = now_utc()
+        for ticket in list_tickets_by_ticket_ids(session, affected_ticket_ids):
+            self._sync_ticket_state(session, ticket, tasks_by_ticket[ticket.ticket_id], now=now)
         return len(rows)
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import os
 import socket
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Optional
 
-from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
@@ -17,21 +18,46 @@ def _default_worker_id() -> str:
 
 class Settings(BaseSettings):
     database_url: str = "sqlite:///./evercore.db"
+    auto_migrate: bool = True
+    db_query_cache_size: int = 1200
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle_seconds: int = 1800
     api_host: str = "0.0.0.0"
     api_port: int = 8010
+    api_threadpool_size: int = 40
+    api_workers: int = 1
+    api_access_log: bool = False
+    api_backlog: int = 2048
+    api_limit_concurrency: int = 1000
+    api_timeout_keep_alive: int = 30
+    api_run_scheduler: bool = False
+    api_run_worker: bool = False
+    scheduler_interval_seconds: float = 5.0
+    scheduler_max_idle_seconds: float = 60.0
     workflow_dir: str = "./workflows"
     default_workflow_key: str = "default_ticket"
+    worker_concurrency: int = 1
     worker_poll_interval_seconds: float = 2.0
-    worker_id: str = Field(default_factory=_default_worker_id)
+    worker_id: Optional[str] = None
     task_lease_seconds: int = 300
     default_task_timeout_seconds: int = 300
     stale_task_timeout_seconds: int = 900
+    cancel_sweep_interval_seconds: float = 10.0
     default_max_attempts: int = 3
     retry_base_seconds: int = 10
     retry_max_seconds: int = 600
     event_wait_poll_interval_seconds: int = 15
+    event_wait_listen_seconds: float = 5.0
     schedule_batch_size: int = 10
     default_lemlem_model: str = "openrouter:gemini-2.5-flash"
+    model_data_ttl_seconds: float = 30.0
+    llm_max_concurrency: int = 8
+    llm_cache_size: int = 256
+    llm_cache_ttl_seconds: float = 3600.0
+    llm_prompt_caching: bool = False
+    llm_semantic_threshold: float = 0.97
+    llm_semantic_cache_size: int = 512
 
     class Config:
         env_file = ".env"
@@ -42,5 +68,16 @@ class Settings(BaseSettings):
     def workflow_dir_path(self) -> Path:
         return Path(self.workflow_dir).expanduser().resolve()
 
+    @cached_property
+    def resolved_worker_id(self) -> str:
+        """`worker_id`, or a hostname/pid default looked up on first access."""
+        return self.worker_id or _default_worker_id()
 
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """The process-wide Settings, parsed from the environment and `.env` once."""
+    return Settings()
+
+
+settings = get_settings()
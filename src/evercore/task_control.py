@@ -5,10 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable
 
-from sqlmodel import Session
+from sqlalchemy import and_
+from sqlmodel import Session, select
 
 from .models import Task, Ticket
-from .repositories import get_task, get_ticket_by_ticket_id
 
 
 @dataclass
@@ -36,25 +36,43 @@ class TaskControl:
         self.ticket_id = ticket_id
 
     def snapshot(self) -> TaskControlSnapshot:
+        """Read the gate columns of the ticket and its task in one round-trip.
+
+        The task is outer-joined onto the ticket, so a missing ticket also
+        reports the task as missing; either way the executor should stop.
+        """
+        statement = (
+            select(
+                Ticket.paused,
+                Ticket.approval_required,
+                Ticket.approval_status,
+                Task.id,
+                Task.state,
+                Task.cancel_requested,
+            )
+            .outerjoin(Task, and_(Task.id == self.task_id, Task.ticket_id == Ticket.ticket_id))
+            .where(Ticket.ticket_id == self.ticket_id)
+        )
         session = self._session_factory()
         try:
-            task: Task | None = get_task(session, self.task_id)
-            ticket: Ticket | None = get_ticket_by_ticket_id(session, self.ticket_id)
-            task_exists = task is not None
-            ticket_exists = ticket is not None
-            approval_pending = bool(
-                ticket_exists
-                and ticket
-                and ticket.approval_required
-                and ticket.approval_status == "pending"
-            )
+            row = session.exec(statement).first()
+            if row is None:
+                return TaskControlSnapshot(
+                    task_exists=False,
+                    task_state=None,
+                    cancel_requested=False,
+                    ticket_exists=False,
+                    ticket_paused=False,
+                    approval_pending=False,
+                )
+            task_exists = row.id is not None
             return TaskControlSnapshot(
                 task_exists=task_exists,
-                task_state=None if task is None else task.state,
-                cancel_requested=bool(task.cancel_requested) if task else False,
-                ticket_exists=ticket_exists,
-                ticket_paused=bool(ticket.paused) if ticket else False,
-                approval_pending=approval_pending,
+                task_state=row.state,
+                cancel_requested=bool(row.cancel_requested) if task_exists else False,
+                ticket_exists=True,
+                ticket_paused=bool(row.paused),
+                approval_pending=bool(row.approval_required and row.approval_status == "pending"),
             )
         finally:
             try:
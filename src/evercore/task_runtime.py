@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-
-import pytz
+from datetime import datetime, timedelta, timezone
 
 
 @dataclass(frozen=True)
@@ -18,7 +16,7 @@ class TaskRuntimePolicy:
 
 
 def utcnow() -> datetime:
-    return datetime.now(pytz.UTC)
+    return datetime.now(timezone.utc)
 
 
 def normalize_max_attempts(value: int | None, default_max_attempts: int) -> int:
@@ -36,14 +34,17 @@ def is_retry_ready(now: datetime, next_run_at: datetime | None) -> bool:
     if next_run_at is None:
         return True
     if next_run_at.tzinfo is None:
-        next_run_at = pytz.UTC.localize(next_run_at)
+        next_run_at = next_run_at.replace(tzinfo=timezone.utc)
     return next_run_at <= now
 
 
 def compute_retry_delay_seconds(attempt_count: int, retry_base_seconds: int, retry_max_seconds: int) -> int:
     base = max(int(retry_base_seconds or 1), 1)
     maximum = max(int(retry_max_seconds or base), base)
-    return min(maximum, base * (2 ** max(0, int(attempt_count) - 1)))
+    # Past bit_length(maximum) doublings the cap always wins, so large attempt counts
+    # never build huge intermediate ints.
+    doublings = min(max(0, int(attempt_count) - 1), maximum.bit_length())
+    return min(maximum, base << doublings)
 
 
 def compute_next_retry_at(
@@ -64,6 +65,10 @@ def should_dead_letter(attempt_count: int, max_attempts: int) -> bool:
     return int(attempt_count) >= max(int(max_attempts), 1)
 
 
+def compute_stale_cutoff(now: datetime, stale_task_timeout_seconds: int) -> datetime:
+    return now - timedelta(seconds=max(int(stale_task_timeout_seconds or 1), 1))
+
+
 def is_stale_running_task(
     now: datetime,
     *,
@@ -73,11 +78,10 @@ def is_stale_running_task(
 ) -> bool:
     if lease_expires_at_value is not None:
         if lease_expires_at_value.tzinfo is None:
-            lease_expires_at_value = pytz.UTC.localize(lease_expires_at_value)
+            lease_expires_at_value = lease_expires_at_value.replace(tzinfo=timezone.utc)
         return lease_expires_at_value <= now
     if started_at is None:
         return False
     if started_at.tzinfo is None:
-        started_at = pytz.UTC.localize(started_at)
-    stale_cutoff = now - timedelta(seconds=max(int(stale_task_timeout_seconds or 1), 1))
-    return started_at <= stale_cutoff
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    return started_at <= compute_stale_cutoff(now, stale_task_timeout_seconds)
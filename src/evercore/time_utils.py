@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-
-import pytz
+from datetime import datetime, timezone
 
 
 def now_utc() -> datetime:
-    return datetime.now(pytz.UTC)
+    return datetime.now(timezone.utc)
 
 
 def coerce_utc(value: datetime | None) -> datetime | None:
+    # Runs per datetime field when serializing rows, so the common cases avoid
+    # astimezone(): psycopg returns timezone.utc for a UTC session and SQLite
+    # hands back naive values.
     if value is None:
         return None
-    if value.tzinfo is None:
-        return pytz.UTC.localize(value)
-    return value.astimezone(pytz.UTC)
+    tzinfo = value.tzinfo
+    if tzinfo is timezone.utc:
+        return value
+    if tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
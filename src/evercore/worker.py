@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 
@@ -16,12 +17,13 @@ logger = logging.getLogger(__name__)
 
 def main() -> None:
     logging.basicConfig(level=logging.INFO)
-    create_db_and_tables()
+    if settings.auto_migrate:
+        create_db_and_tables()
 
     ticket_service = TicketService(WorkflowLoader(settings.workflow_dir_path))
     scheduler_service = SchedulerService(ticket_service)
     service = WorkerService(ExecutorRegistry.default())
-    logger.info("starting evercore worker: %s", settings.worker_id)
+    logger.info("starting evercore worker: %s", settings.resolved_worker_id)
 
     while True:
         try:
@@ -30,8 +32,14 @@ def main() -> None:
                     session,
                     limit=settings.schedule_batch_size,
                 )
-                result = service.process_once(session, worker_id=settings.worker_id)
-            if not result.processed and scheduled_count == 0:
+                if settings.worker_concurrency > 1:
+                    results = asyncio.run(
+                        service.process_batch_async(session, worker_id=settings.resolved_worker_id)
+                    )
+                    processed = any(result.processed for result in results)
+                else:
+                    processed = service.process_once(session, worker_id=settings.resolved_worker_id).processed
+            if not processed and scheduled_count == 0:
                 time.sleep(settings.worker_poll_interval_seconds)
         except KeyboardInterrupt:
             logger.info("worker interrupted, exiting")
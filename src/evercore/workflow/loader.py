@@ -2,31 +2,63 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 from .types import WorkflowDefinition
 from .validator import WorkflowValidator
 
 
 class WorkflowLoader:
-    """Loads and validates YAML workflows from a directory."""
+    """Loads and validates YAML workflows from a directory.
+
+    Parsed definitions are cached per workflow key and reused until the
+    file's modification time changes. The cache keeps the most recently used
+    `cache_size` keys.
+    """
+
+    cache_size = 64
 
     def __init__(self, workflow_dir: str | Path):
         self.workflow_dir = Path(workflow_dir).expanduser().resolve()
         self.validator = WorkflowValidator()
+        self._cache: OrderedDict[str, tuple[int, WorkflowDefinition]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def load(self, workflow_key: str) -> WorkflowDefinition:
         file_path = self.workflow_dir / f"{workflow_key}.yaml"
-        if not file_path.exists():
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            with self._cache_lock:
+                self._cache.pop(workflow_key, None)
             raise FileNotFoundError(
                 f"Workflow definition not found for '{workflow_key}' at {file_path}"
-            )
+            ) from None
+
+        with self._cache_lock:
+            cached = self._cache.get(workflow_key)
+            if cached is not None and cached[0] == mtime_ns:
+                self._cache.move_to_end(workflow_key)
+                return cached[1]
 
         with file_path.open("r", encoding="utf-8") as handle:
-            payload = yaml.safe_load(handle) or {}
+            payload = yaml.load(handle, Loader=_SafeLoader) or {}
 
         if "key" not in payload:
             payload["key"] = workflow_key
-        return self.validator.validate(payload)
+        definition = self.validator.validate(payload)
+        with self._cache_lock:
+            self._cache[workflow_key] = (mtime_ns, definition)
+            self._cache.move_to_end(workflow_key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return definition
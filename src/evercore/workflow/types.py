@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 class StageTransition(BaseModel):
@@ -24,6 +24,22 @@ class StageDefinition(BaseModel):
     transitions: List[StageTransition] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    _transitions_by_target: Dict[str, List[StageTransition]] = PrivateAttr(default_factory=dict)
+    _indexed_transitions: Optional[List[StageTransition]] = PrivateAttr(default=None)
+
+    def transitions_to(self, target: str | None) -> List[StageTransition]:
+        """Transitions in declaration order, narrowed to `target` when one is given."""
+        if not target:
+            return self.transitions
+        # Re-index when `transitions` was replaced (assignment, model_copy(update=...)).
+        if self._indexed_transitions is not self.transitions:
+            index: Dict[str, List[StageTransition]] = {}
+            for transition in self.transitions:
+                index.setdefault(transition.target, []).append(transition)
+            self._transitions_by_target = index
+            self._indexed_transitions = self.transitions
+        return self._transitions_by_target.get(target, [])
+
 
 class WorkflowDefinition(BaseModel):
     """A complete workflow specification."""
@@ -35,9 +51,23 @@ class WorkflowDefinition(BaseModel):
     initial_stage: str = Field(..., min_length=1)
     stages: List[StageDefinition] = Field(default_factory=list)
 
+    _stages_by_id: Dict[str, StageDefinition] = PrivateAttr(default_factory=dict)
+    _indexed_stages: Optional[List[StageDefinition]] = PrivateAttr(default=None)
+
+    def _stage_index(self) -> Dict[str, StageDefinition]:
+        # Re-index when `stages` was replaced (assignment, model_copy(update=...));
+        # the lists themselves are not meant to be mutated in place.
+        if self._indexed_stages is not self.stages:
+            index: Dict[str, StageDefinition] = {}
+            for stage in self.stages:
+                index.setdefault(stage.id, stage)
+            self._stages_by_id = index
+            self._indexed_stages = self.stages
+        return self._stages_by_id
+
     @model_validator(mode="after")
     def validate_stage_graph(self) -> "WorkflowDefinition":
-        stage_ids = {stage.id for stage in self.stages}
+        stage_ids = self._stage_index()
         if self.initial_stage not in stage_ids:
             raise ValueError(
                 f"initial_stage '{self.initial_stage}' is not present in stages"
@@ -53,7 +83,4 @@ class WorkflowDefinition(BaseModel):
         return self
 
     def stage_by_id(self, stage_id: str) -> StageDefinition | None:
-        for stage in self.stages:
-            if stage.id == stage_id:
-                return stage
-        return None
+        return self._stage_index().get(stage_id)
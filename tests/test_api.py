@@ -1,3 +1,4 @@
+import json
 import unittest
 import time
 
@@ -5,10 +6,22 @@ from fastapi.testclient import TestClient
 
 from _test_support import reset_database
 from evercore import api
+from evercore.agent_runtime import AgentRuntimeResult, LemlemAgentRuntime
 from evercore.executors.registry import ExecutorRegistry, NoopExecutor, WaitForEventExecutor
 from evercore.services import WorkerService
 
 
+class _EchoRuntime(LemlemAgentRuntime):
+    def __init__(self):
+        pass
+
+    def run_prompt(self, *, prompt, model=None, system_prompt=None, temperature=None):
+        del system_prompt, temperature
+        if prompt == "fail":
+            return AgentRuntimeResult(success=False, error="boom")
+        return AgentRuntimeResult(success=True, text=f"echo: {prompt}", model_used=model)
+
+
 class ApiTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -138,6 +151,26 @@ class ApiTests(unittest.TestCase):
         self.assertEqual(ticket_after_second.json()["tasks"][0]["id"], task_id)
         self.assertEqual(ticket_after_second.json()["tasks"][0]["state"], "completed")
 
+    def test_ticket_events_stream_as_jsonl(self):
+        ticket_id = self.client.post(
+            "/tickets",
+            json={"title": "stream ticket", "workflow_key": "default_ticket"},
+        ).json()["ticket_id"]
+        for event_type in ("first", "second"):
+            self.client.post(f"/tickets/{ticket_id}/events", json={"event_type": event_type})
+
+        response = self.client.get(f"/tickets/{ticket_id}/events.jsonl")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(
+            [line["event_type"] for line in lines],
+            [row["event_type"] for row in self.client.get(f"/tickets/{ticket_id}/events").json()],
+        )
+
+        missing = self.client.get("/tickets/tkt-missing/events.jsonl")
+        self.assertEqual(missing.status_code, 404)
+
     def test_schedule_endpoints_and_trigger(self):
         create_schedule = self.client.post(
             "/schedules",
@@ -167,6 +200,48 @@ class ApiTests(unittest.TestCase):
         self.assertEqual(resume_response.status_code, 200)
         self.assertTrue(resume_response.json()["active"])
 
+    def test_run_due_schedules_endpoint(self):
+        create_schedule = self.client.post(
+            "/schedules",
+            json={"schedule_key": "due-now", "interval_seconds": 60, "task_key": "noop"},
+        )
+        self.assertEqual(create_schedule.status_code, 201)
+
+        worker_response = self.client.post("/workers/run-once")
+        self.assertEqual(worker_response.status_code, 200)
+        self.assertFalse(worker_response.json()["processed"])
+
+        run_due = self.client.post("/schedules/run-due")
+        self.assertEqual(run_due.status_code, 200)
+        self.assertEqual(run_due.json()["processed"], 1)
+
+        tickets = self.client.get("/tickets")
+        self.assertEqual(len(tickets.json()), 1)
+
+    def test_agent_batch_runs_prompts_in_order(self):
+        original_runtime = api.agent_runtime
+        api.agent_runtime = _EchoRuntime()
+        try:
+            response = self.client.post(
+                "/agents/run-batch",
+                json={
+                    "prompts": [
+                        {"prompt": "one", "model": "m1"},
+                        {"prompt": "fail"},
+                        {"prompt": "three"},
+                    ]
+                },
+            )
+        finally:
+            api.agent_runtime = original_runtime
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([row["success"] for row in body], [True, False, True])
+        self.assertEqual(body[0]["text"], "echo: one")
+        self.assertEqual(body[0]["model_used"], "m1")
+        self.assertEqual(body[1]["error"], "boom")
+        self.assertEqual(body[2]["text"], "echo: three")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ from evercore.executors.registry import (
     NoopExecutor,
 )
 from evercore.execution import ExecutionResult, TaskExecutor
+from evercore.llm_cache import ResponseCache, SemanticResponseCache
 from evercore.models import Task, Ticket
 
 
@@ -41,6 +42,15 @@ class _FakeRuntime:
         )
 
 
+class _CountingRuntime(_FakeRuntime):
+    def __init__(self):
+        self.prompt_calls = 0
+
+    def run_prompt(self, **kwargs):
+        self.prompt_calls += 1
+        return super().run_prompt(**kwargs)
+
+
 class _DummyExecutor(TaskExecutor):
     def execute(self, ticket, task):
         del ticket, task
@@ -72,7 +82,8 @@ class ExecutorsTests(unittest.TestCase):
         )
         result = executor.execute(ticket, task)
         self.assertTrue(result.success)
-        self.assertEqual(result.output["text"], "echo: hello")
+        # The default system prompt is ticket-independent; the ticket id rides in the user turn.
+        self.assertEqual(result.output["text"], "echo: Ticket: t\n\nhello")
         self.assertEqual(result.output["model_used"], "test-model")
 
     def test_lemlem_agent_json_executor_validates_inputs(self):
@@ -91,6 +102,61 @@ class ExecutorsTests(unittest.TestCase):
         self.assertFalse(result_missing.success)
         self.assertFalse(result_bad_payload.success)
 
+    def test_lemlem_prompt_executor_reuses_cached_deterministic_response(self):
+        runtime = _CountingRuntime()
+        executor = LemlemPromptExecutor(runtime, cache=ResponseCache(maxsize=8, ttl_seconds=60))
+        ticket = Ticket(ticket_id="t")
+        deterministic = Task(
+            ticket_id="t",
+            task_key="lemlem_prompt",
+            payload={"prompt": "hello", "temperature": 0},
+        )
+        sampled = Task(
+            ticket_id="t",
+            task_key="lemlem_prompt",
+            payload={"prompt": "hello", "temperature": 0.7},
+        )
+        provider_default = Task(ticket_id="t", task_key="lemlem_prompt", payload={"prompt": "hello"})
+
+        first = executor.execute(ticket, deterministic)
+        first.output["usage"]["total_tokens"] = -1
+        second = executor.execute(ticket, deterministic)
+        self.assertEqual(runtime.prompt_calls, 1)
+        self.assertEqual(second.output["usage"], {"total_tokens": 10})
+
+        executor.execute(ticket, sampled)
+        executor.execute(ticket, sampled)
+        self.assertEqual(runtime.prompt_calls, 3)
+
+        executor.execute(ticket, provider_default)
+        executor.execute(ticket, provider_default)
+        self.assertEqual(runtime.prompt_calls, 5)
+
+    def test_lemlem_prompt_executor_semantic_cache_matches_similar_prompts(self):
+        runtime = _CountingRuntime()
+
+        def embed(text):
+            return [1.0, 0.0] if "weather" in text else [0.0, 1.0]
+
+        executor = LemlemPromptExecutor(
+            runtime,
+            semantic_cache=SemanticResponseCache(embed, threshold=0.95, maxsize=8),
+        )
+        ticket = Ticket(ticket_id="t")
+
+        def run(prompt):
+            return executor.execute(
+                ticket, Task(ticket_id="t", task_key="lemlem_prompt", payload={"prompt": prompt, "temperature": 0})
+            )
+
+        first = run("what is the weather")
+        paraphrase = run("tell me the weather")
+        unrelated = run("summarize the ticket")
+
+        self.assertEqual(runtime.prompt_calls, 2)
+        self.assertEqual(paraphrase.output["text"], first.output["text"])
+        self.assertEqual(unrelated.output["text"], "echo: Ticket: t\n\nsummarize the ticket")
+
     def test_registry_register_and_get(self):
         registry = ExecutorRegistry(executors={})
         dummy = _DummyExecutor()
@@ -4,10 +4,16 @@ from sqlmodel import select
 
 from _test_support import WORKFLOW_DIR, reset_database
 from evercore.db import session_scope
-from evercore.models import WorkerHeartbeat
+from evercore.models import Task, TaskLog, WorkerHeartbeat
 from evercore.repositories import (
     add_task_log,
+    add_ticket_event,
+    claim_tasks,
+    consume_ticket_event,
+    finalize_task_and_log,
+    get_ticket_by_ticket_id,
     list_tickets,
+    renew_task_leases,
     update_heartbeat,
 )
 from evercore.schemas import TaskCreateRequest, TicketCreateRequest
@@ -30,6 +36,99 @@ class RepositoryTests(unittest.TestCase):
             tickets = list_tickets(session, limit=1)
             self.assertEqual(len(tickets), 1)
             self.assertEqual(tickets[0].title, "second")
+            next_page = list_tickets(session, limit=1, cursor=(tickets[0].created_at, tickets[0].id))
+            self.assertEqual([ticket.title for ticket in next_page], ["first"])
+
+    def test_list_tickets_cursor_keeps_rows_sharing_a_timestamp(self):
+        with session_scope() as session:
+            created = [
+                self.ticket_service.create_ticket(session, TicketCreateRequest(title=title))
+                for title in ("a", "b", "c")
+            ]
+            for ticket in created:
+                ticket.created_at = created[0].created_at
+            session.flush()
+
+            seen: list[str] = []
+            cursor = None
+            while page := list_tickets(session, limit=1, cursor=cursor):
+                seen.append(page[0].title)
+                cursor = (page[0].created_at, page[0].id)
+            self.assertEqual(seen, ["c", "b", "a"])
+
+    def test_get_ticket_by_ticket_id_reuses_session_instance(self):
+        with session_scope() as session:
+            ticket = self.ticket_service.create_ticket(session, TicketCreateRequest(title="lookup"))
+            ticket_id = ticket.ticket_id
+
+        with session_scope() as session:
+            listed = list_tickets(session, limit=10)
+            self.assertIs(get_ticket_by_ticket_id(session, ticket_id), listed[0])
+            self.assertIsNone(get_ticket_by_ticket_id(session, "tkt-missing"))
+
+    def test_claim_tasks_claims_only_runnable_tasks_once(self):
+        with session_scope() as session:
+            ticket = self.ticket_service.create_ticket(session, TicketCreateRequest(title="claim"))
+            first = self.ticket_service.create_task(
+                session, ticket.ticket_id, TaskCreateRequest(task_key="noop")
+            )
+            self.ticket_service.create_task(
+                session,
+                ticket.ticket_id,
+                TaskCreateRequest(task_key="noop", depends_on_task_ids=[first.id]),
+            )
+            paused = self.ticket_service.create_ticket(session, TicketCreateRequest(title="paused"))
+            self.ticket_service.pause_ticket(session, paused.ticket_id)
+            self.ticket_service.create_task(
+                session, paused.ticket_id, TaskCreateRequest(task_key="noop")
+            )
+            first_id = first.id
+
+        with session_scope() as session:
+            claimed = claim_tasks(
+                session, "w1", batch_size=5, lease_seconds=30, default_max_attempts=3
+            )
+            self.assertEqual([task.id for task in claimed], [first_id])
+            self.assertEqual(claimed[0].state, "running")
+            self.assertEqual(claimed[0].claimed_by, "w1")
+            self.assertEqual(claimed[0].attempt_count, 1)
+
+        with session_scope() as session:
+            self.assertEqual(
+                claim_tasks(session, "w2", batch_size=5, lease_seconds=30, default_max_attempts=3),
+                [],
+            )
+
+    def test_renew_task_leases_flags_paused_ticket_and_skips_other_workers(self):
+        with session_scope() as session:
+            ticket = self.ticket_service.create_ticket(session, TicketCreateRequest(title="lease"))
+            self.ticket_service.create_task(session, ticket.ticket_id, TaskCreateRequest(task_key="noop"))
+            ticket_id = ticket.ticket_id
+
+        with session_scope() as session:
+            (task,) = claim_tasks(session, "w1", batch_size=1, lease_seconds=30, default_max_attempts=3)
+            task_id = task.id
+            self.ticket_service.pause_ticket(session, ticket_id)
+
+        with session_scope() as session:
+            self.assertEqual(renew_task_leases(session, leases={task_id: "w1"}, lease_seconds=30), {task_id})
+            self.assertEqual(renew_task_leases(session, leases={task_id: "w2"}, lease_seconds=30), set())
+            row = session.exec(select(Task).where(Task.id == task_id)).one()
+            self.assertTrue(row.cancel_requested)
+            self.assertIsNotNone(row.cancel_requested_at)
+            self.assertEqual(row.state, "running")
+
+    def test_consume_ticket_event_only_succeeds_once(self):
+        with session_scope() as session:
+            ticket = self.ticket_service.create_ticket(session, TicketCreateRequest(title="events"))
+            event = add_ticket_event(
+                session, ticket_id=ticket.ticket_id, event_type="go", payload={"n": 1}
+            )
+            session.flush()
+            consumed = consume_ticket_event(session, event_id=event.id, task_id=None)
+            self.assertEqual(consumed.event_type, "go")
+            self.assertEqual(consumed.payload, {"n": 1})
+            self.assertIsNone(consume_ticket_event(session, event_id=event.id, task_id=None))
 
     def test_update_heartbeat_creates_then_updates_row(self):
         with session_scope() as session:
@@ -54,6 +153,26 @@ class RepositoryTests(unittest.TestCase):
             self.assertEqual(log.details, {})
             self.assertEqual(log.log_type, "info")
 
+    def test_finalize_task_and_log_writes_row_and_log(self):
+        with session_scope() as session:
+            ticket = self.ticket_service.create_ticket(session, TicketCreateRequest(title="final"))
+            task = self.ticket_service.create_task(session, ticket.ticket_id, TaskCreateRequest(task_key="noop"))
+            task_id = task.id
+
+        with session_scope() as session:
+            finalize_task_and_log(
+                session,
+                task_id,
+                {"state": "failed", "error_message": "boom"},
+                {"log_type": "error", "message": "boom", "success": False},
+            )
+
+        with session_scope() as session:
+            row = session.exec(select(Task).where(Task.id == task_id)).one()
+            log = session.exec(select(TaskLog).where(TaskLog.task_id == task_id)).one()
+            self.assertEqual((row.state, row.error_message), ("failed", "boom"))
+            self.assertEqual((log.log_type, log.message, log.success, log.details), ("error", "boom", False, {}))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,5 @@
 import unittest
-from datetime import datetime
-
-import pytz
+from datetime import datetime, timedelta, timezone
 
 from _test_support import reset_database  # noqa: F401
 from evercore.time_utils import coerce_utc, now_utc
@@ -11,20 +9,25 @@ class TimeUtilsTests(unittest.TestCase):
     def test_now_utc_is_timezone_aware(self):
         value = now_utc()
         self.assertIsNotNone(value.tzinfo)
-        self.assertEqual(value.tzinfo, pytz.UTC)
+        self.assertEqual(value.tzinfo, timezone.utc)
 
     def test_coerce_utc_localizes_naive(self):
         naive = datetime(2026, 1, 2, 3, 4, 5)
         coerced = coerce_utc(naive)
         self.assertIsNotNone(coerced)
-        self.assertEqual(coerced.tzinfo, pytz.UTC)
+        self.assertEqual(coerced.tzinfo, timezone.utc)
 
     def test_coerce_utc_converts_non_utc_timezone(self):
-        eastern = pytz.timezone("US/Eastern")
-        local = eastern.localize(datetime(2026, 1, 2, 3, 4, 5))
+        eastern = timezone(timedelta(hours=-5))
+        local = datetime(2026, 1, 2, 3, 4, 5, tzinfo=eastern)
         coerced = coerce_utc(local)
         self.assertIsNotNone(coerced)
-        self.assertEqual(coerced.tzinfo, pytz.UTC)
+        self.assertEqual(coerced, local)
+        self.assertEqual(coerced.tzinfo, timezone.utc)
+
+    def test_coerce_utc_returns_utc_values_unchanged(self):
+        value = datetime(2026, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+        self.assertIs(coerce_utc(value), value)
 
     def test_coerce_utc_none_passthrough(self):
         self.assertIsNone(coerce_utc(None))
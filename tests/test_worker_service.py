@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from datetime import timedelta
 import threading
@@ -7,12 +8,13 @@ from unittest.mock import patch
 from sqlmodel import select
 
 from _test_support import WORKFLOW_DIR, reset_database
-from evercore.db import session_scope
+from evercore.db import get_session, session_scope
 from evercore.execution import ExecutionResult, TaskExecutor
-from evercore.executors.registry import ExecutorRegistry
+from evercore.executors.registry import ExecutorRegistry, WaitForEventExecutor
 from evercore.models import Task, TaskLog, WorkerHeartbeat
 from evercore.schemas import TaskCreateRequest, TicketCreateRequest
 from evercore.services import TicketService, WorkerService
+from evercore.task_control import TaskControl
 from evercore.time_utils import coerce_utc, now_utc
 from evercore.workflow import WorkflowLoader
 
@@ -184,6 +186,118 @@ class WorkerServiceTests(unittest.TestCase):
             self.assertTrue(result.processed)
             row = session.exec(select(Task).where(Task.id == task_id)).first()
             self.assertEqual(row.state, "cancelled")
+            logs = session.exec(select(TaskLog).where(TaskLog.task_id == task_id)).all()
+            self.assertEqual([log.log_type for log in logs], ["warning"])
+
+    def test_stale_running_task_is_reaped_into_retry_with_log(self):
+        service = WorkerService(ExecutorRegistry(executors={}))
+        with session_scope() as session:
+            ticket = self.ticket_service.create_ticket(session, TicketCreateRequest(title="stale"))
+            task = self.ticket_service.create_task(
+                session, ticket.ticket_id, TaskCreateRequest(task_key="simple", max_attempts=3)
+            )
+            task.state = "running"
+            task.claimed_by = "gone-worker"
+            task.started_at = now_utc() - timedelta(hours=1)
+            task.lease_expires_at = now_utc() - timedelta(minutes=5)
+            session.add(task)
+            task_id = task.id
+
+        with session_scope() as session:
+            service._reap_stale_running_tasks(session.get_bind())
+
+        with session_scope() as session:
+            task_row = session.exec(select(Task).where(Task.id == task_id)).one()
+            messages = [
+                row.message for row in session.exec(select(TaskLog).where(TaskLog.task_id == task_id)).all()
+            ]
+            self.assertEqual(task_row.state, "retrying")
+            self.assertEqual(task_row.attempt_count, 1)
+            self.assertEqual(len(messages), 1)
+            self.assertIn("lease expired", messages[0])
+
+    def test_parked_task_is_tracked_without_explicit_add(self):
+        service = WorkerService(ExecutorRegistry(executors={}))
+        with session_scope() as session:
+            ticket = self.ticket_service.create_ticket(session, TicketCreateRequest(title="park"))
+            task = self.ticket_service.create_task(
+                session, ticket.ticket_id, TaskCreateRequest(task_key="simple")
+            )
+            task_id = task.id
+
+        with session_scope() as session:
+            row = session.exec(select(Task).where(Task.id == task_id)).one()
+            service._park_task_for_pause(session, row)
+            self.assertIn(row, session.dirty)
+
+        with session_scope() as session:
+            row = session.exec(select(Task).where(Task.id == task_id)).one()
+            self.assertEqual(row.state, "paused")
+
+    def test_held_ticket_tasks_are_skipped_by_claim_and_parked_by_sweep(self):
+        service = WorkerService(ExecutorRegistry(executors={"simple": _SuccessExecutor()}))
+        with session_scope() as session:
+            paused = self.ticket_service.create_ticket(session, TicketCreateRequest(title="paused"))
+            gated = self.ticket_service.create_ticket(session, TicketCreateRequest(title="gated"))
+            paused_task = self.ticket_service.create_task(
+                session, paused.ticket_id, TaskCreateRequest(task_key="simple")
+            )
+            gated_task = self.ticket_service.create_task(
+                session, gated.ticket_id, TaskCreateRequest(task_key="simple")
+            )
+            # Holds set behind the lifecycle methods' backs leave the tasks queued.
+            paused.paused = True
+            gated.approval_required = True
+            gated.approval_status = "pending"
+            session.add(paused)
+            session.add(gated)
+            task_ids = {paused_task.id: "paused", gated_task.id: "blocked"}
+
+        with session_scope() as session:
+            result = service.process_once(session, worker_id="worker-held")
+            self.assertFalse(result.processed)
+            for task_id, state in task_ids.items():
+                row = session.exec(select(Task).where(Task.id == task_id)).one()
+                self.assertEqual(row.state, state)
+                self.assertIsNone(row.next_run_at)
+                logs = session.exec(select(TaskLog).where(TaskLog.task_id == task_id)).all()
+                self.assertEqual([log.message.split(":")[0] for log in logs], ["task parked"])
+
+    def test_task_control_snapshot_reports_pause_and_missing_rows(self):
+        with session_scope() as session:
+            ticket = self.ticket_service.create_ticket(session, TicketCreateRequest(title="control"))
+            task = self.ticket_service.create_task(
+                session, ticket.ticket_id, TaskCreateRequest(task_key="simple")
+            )
+            ticket_id = ticket.ticket_id
+            task_id = task.id
+
+        control = TaskControl(session_factory=get_session, task_id=task_id, ticket_id=ticket_id)
+        self.assertFalse(control.should_stop())
+        self.assertFalse(TaskControl(get_session, task_id + 1, ticket_id).snapshot().task_exists)
+        self.assertFalse(TaskControl(get_session, task_id, "missing").snapshot().ticket_exists)
+
+        with session_scope() as session:
+            self.ticket_service.pause_ticket(session, ticket_id)
+        snapshot = control.snapshot()
+        self.assertTrue(snapshot.ticket_paused)
+        self.assertTrue(snapshot.should_stop)
+
+    def test_wait_for_event_defers_without_blocking_off_postgres(self):
+        service = WorkerService(ExecutorRegistry(executors={"wait_for_event": WaitForEventExecutor()}))
+        with session_scope() as session:
+            ticket = self.ticket_service.create_ticket(session, TicketCreateRequest(title="wait"))
+            self.ticket_service.create_task(
+                session,
+                ticket.ticket_id,
+                TaskCreateRequest(task_key="wait_for_event", payload={"event_type": "go"}),
+            )
+
+        started = time.monotonic()
+        with session_scope() as session:
+            result = service.process_once(session, worker_id="worker-wait")
+        self.assertIn("deferred", result.message)
+        self.assertLess(time.monotonic() - started, 1.0)
 
     def test_deferred_result_requeues_without_consuming_attempts(self):
         service = WorkerService(ExecutorRegistry(executors={"defer": _DeferExecutor()}))
@@ -204,6 +318,29 @@ class WorkerServiceTests(unittest.TestCase):
             self.assertEqual(row.attempt_count, 0)
             self.assertIsNotNone(row.next_run_at)
 
+    def test_process_batch_async_processes_up_to_max_tasks(self):
+        service = WorkerService(ExecutorRegistry(executors={"simple": _SuccessExecutor()}))
+        with session_scope() as session:
+            ticket = self.ticket_service.create_ticket(session, TicketCreateRequest(title="batch"))
+            task_ids = [
+                self.ticket_service.create_task(
+                    session, ticket.ticket_id, TaskCreateRequest(task_key="simple")
+                ).id
+                for _ in range(3)
+            ]
+
+        with session_scope() as session:
+            results = asyncio.run(
+                service.process_batch_async(session, worker_id="worker-batch", max_tasks=5)
+            )
+            states = [
+                session.exec(select(Task).where(Task.id == task_id)).first().state
+                for task_id in task_ids
+            ]
+
+        self.assertEqual([result.processed for result in results], [True, True, True, False])
+        self.assertEqual(states, ["completed", "completed", "completed"])
+
     def test_multi_worker_contention_does_not_double_claim_single_task(self):
         started_event = threading.Event()
         finish_event = threading.Event()
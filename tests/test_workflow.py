@@ -1,3 +1,4 @@
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -36,6 +37,24 @@ class WorkflowTests(unittest.TestCase):
         with self.assertRaises(WorkflowValidationError):
             validator.validate(payload)
 
+    def test_stage_indexes_follow_copied_definitions(self):
+        definition = WorkflowValidator().validate(
+            {
+                "key": "copy",
+                "initial_stage": "queued",
+                "stages": [
+                    {"id": "queued", "executor": "x", "transitions": [{"target": "finished"}]},
+                ],
+            }
+        )
+        queued = definition.stage_by_id("queued")
+        self.assertEqual(len(queued.transitions_to("finished")), 1)
+
+        emptied = definition.model_copy(update={"stages": []})
+        self.assertIsNone(emptied.stage_by_id("queued"))
+        self.assertIs(definition.stage_by_id("queued"), queued)
+        self.assertEqual(queued.model_copy(update={"transitions": []}).transitions_to("finished"), [])
+
     def test_loader_injects_workflow_key_when_missing(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             workflow_dir = Path(tmp_dir)
@@ -52,6 +71,48 @@ class WorkflowTests(unittest.TestCase):
         self.assertEqual(loaded.key, "custom")
         self.assertEqual(loaded.stage_by_id("queued").id, "queued")
 
+    def test_loader_reuses_definition_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            workflow_dir = Path(tmp_dir)
+            workflow_file = workflow_dir / "custom.yaml"
+            payload = {
+                "version": "1.0.0",
+                "initial_stage": "queued",
+                "stages": [{"id": "queued", "executor": "x"}],
+            }
+            workflow_file.write_text(yaml.safe_dump(payload), encoding="utf-8")
+            loader = WorkflowLoader(workflow_dir)
+            first = loader.load("custom")
+            second = loader.load("custom")
+
+            payload["version"] = "2.0.0"
+            workflow_file.write_text(yaml.safe_dump(payload), encoding="utf-8")
+            stat = workflow_file.stat()
+            os.utime(workflow_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            reloaded = loader.load("custom")
+
+        self.assertIs(first, second)
+        self.assertEqual(reloaded.version, "2.0.0")
+
+    def test_loader_evicts_least_recently_used_definition(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            workflow_dir = Path(tmp_dir)
+            payload = {
+                "version": "1.0.0",
+                "initial_stage": "queued",
+                "stages": [{"id": "queued", "executor": "x"}],
+            }
+            for key in ("a", "b", "c"):
+                (workflow_dir / f"{key}.yaml").write_text(yaml.safe_dump(payload), encoding="utf-8")
+            loader = WorkflowLoader(workflow_dir)
+            loader.cache_size = 2
+            first_a = loader.load("a")
+            loader.load("b")
+            self.assertIs(loader.load("a"), first_a)
+            loader.load("c")
+
+            self.assertEqual(list(loader._cache), ["a", "c"])
+
     def test_loader_missing_file_raises(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             loader = WorkflowLoader(tmp_dir)